@@ -4,23 +4,80 @@ This module handles batch processing of worksheets from Input folders
 and creates personalized versions in Output folders.
 """
 
+import errno
 import logging
+import os
 import shutil
+import threading
+from collections.abc import Iterable, Iterator, Set
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List
+from typing import ClassVar, NamedTuple, Optional, Union
+
+from PIL import Image
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
 
 from worksheet_personalizer.core.pdf_processor import PDFProcessor
 from worksheet_personalizer.core.image_processor import ImageProcessor
+from worksheet_personalizer.core.parallel import create_executor, personalize_student
 from worksheet_personalizer.models.student import Student
-from worksheet_personalizer.settings_manager import SettingsManager
+from worksheet_personalizer.settings_manager import get_settings_manager
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+class FileRecord(NamedTuple):
+    """Name parts of a scanned file, detached from its os.DirEntry."""
+
+    path: str
+    name: str
+    stem: str
+    extension: str
+
+
+def _scan_files(folder: Path, extensions: Set[str]) -> Iterator[FileRecord]:
+    """Yield the files of a folder whose lowercase extension is in extensions.
+
+    The name is split once per entry and only the needed strings are kept,
+    so the DirEntry can be dropped right away. Entries with other extensions
+    are rejected before the is_file() check.
+
+    Args:
+        folder: Folder to scan (not recursive)
+        extensions: Lowercase extensions including the dot
+
+    Yields:
+        FileRecord for each matching file
+    """
+    splitext = os.path.splitext
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            stem, extension = splitext(name)
+            extension = extension.lower()
+            if extension in extensions and entry.is_file():
+                yield FileRecord(entry.path, name, stem, extension)
+
+
+# Worksheet processors and their classes
+Processor = Union[PDFProcessor, ImageProcessor]
+ProcessorClass = type[Processor]
+
+
+def _warm_up_worker() -> None:
+    """Load Pillow plugins in a worker process.
+
+    Runs while the main process is still scanning folders, so the first
+    personalization does not pay for this setup. The Norddruck font is
+    already registered when the worker imports this module.
+    """
+    Image.init()
+
+
 class BatchProcessor:
     """Processes worksheets in batch mode for multiple student groups.
 
@@ -33,12 +90,21 @@ class BatchProcessor:
     """
 
     # Supported worksheet formats
-    PDF_FORMATS = {".pdf"}
-    IMAGE_FORMATS = {".png", ".jpg", ".jpeg"}
+    PDF_FORMATS = frozenset({".pdf"})
+    IMAGE_FORMATS = frozenset({".png", ".jpg", ".jpeg"})
     SUPPORTED_FORMATS = PDF_FORMATS | IMAGE_FORMATS
 
+    # Processor class per worksheet extension, resolved once during the scan
+    PROCESSOR_BY_FORMAT: ClassVar[dict[str, ProcessorClass]] = {
+        **dict.fromkeys(PDF_FORMATS, PDFProcessor),
+        **dict.fromkeys(IMAGE_FORMATS, ImageProcessor),
+    }
+
     # Supported photo formats
-    PHOTO_FORMATS = {".jpg", ".jpeg", ".png"}
+    PHOTO_FORMATS = frozenset({".jpg", ".jpeg", ".png"})
+
+    # Number of finished students per progress bar update
+    PROGRESS_BATCH_SIZE = 8
 
     def __init__(self, base_path: Path) -> None:
         """Initialize batch processor.
@@ -47,9 +113,14 @@ class BatchProcessor:
             base_path: Base directory containing Input-X, Schüler-X, Ausgabe-X folders
         """
         self.base_path = base_path
-        self.settings_manager = SettingsManager()
+        self.settings_manager = get_settings_manager()
         self.groups = ["A", "B", "C"]
 
+        # Worker pool shared by all groups during process_all_groups
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._max_workers = os.cpu_count() or 1
+
         logger.info(f"Initialized batch processor at: {base_path}")
 
     def _get_folder_paths(self, group: str) -> tuple[Path, Path, Path]:
@@ -67,7 +138,7 @@ class BatchProcessor:
 
         return input_folder, students_folder, output_folder
 
-    def _load_students(self, students_folder: Path) -> List[Student]:
+    def _load_students(self, students_folder: Path) -> list[Student]:
         """Load student data from a folder.
 
         Args:
@@ -76,19 +147,18 @@ class BatchProcessor:
         Returns:
             List of Student objects
         """
-        students = []
+        students: list[Student] = []
 
         if not students_folder.exists():
             logger.warning(f"Students folder not found: {students_folder}")
             return students
 
-        for photo_path in students_folder.iterdir():
-            if photo_path.suffix.lower() in self.PHOTO_FORMATS and photo_path.is_file():
-                # Extract student name from filename (without extension)
-                student_name = photo_path.stem
-                student = Student(name=student_name, photo_path=photo_path)
-                students.append(student)
-                logger.debug(f"Loaded student: {student_name}")
+        add_student = students.append
+
+        # Student name is the filename without extension
+        for record in _scan_files(students_folder, self.PHOTO_FORMATS):
+            add_student(Student.from_scanned_file(record.stem, Path(record.path)))
+            logger.debug(f"Loaded student: {record.stem}")
 
         logger.info(f"Loaded {len(students)} students from {students_folder}")
         return students
@@ -103,14 +173,21 @@ class BatchProcessor:
         Returns:
             Path to the created output folder
         """
-        output_folder = output_base / worksheet_name
+        # List existing entries once instead of probing each candidate name
+        try:
+            with os.scandir(output_base) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
 
         # Handle duplicate folder names with numbering
+        folder_name = worksheet_name
         counter = 2
-        while output_folder.exists():
-            output_folder = output_base / f"{worksheet_name}_{counter}"
+        while folder_name in existing:
+            folder_name = f"{worksheet_name}_{counter}"
             counter += 1
 
+        output_folder = output_base / folder_name
         output_folder.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Created output folder: {output_folder}")
 
@@ -119,42 +196,51 @@ class BatchProcessor:
     def _process_worksheet(
         self,
         worksheet_path: Path,
-        students: List[Student],
+        processor_class: ProcessorClass,
+        students: list[Student],
         output_folder: Path,
         progress: Progress,
-        task_id: int
+        task_id: TaskID,
+        add_name: bool
     ) -> None:
         """Process a single worksheet for all students.
 
         Args:
             worksheet_path: Path to the worksheet file
+            processor_class: Processor class for the worksheet format
             students: List of students to personalize for
             output_folder: Folder to save personalized worksheets
             progress: Rich progress instance
             task_id: Progress task ID
+            add_name: Whether to add student names
         """
         if not students:
             console.print(f"[yellow]⚠️  Keine Schüler gefunden für {worksheet_path.name}[/yellow]")
             return
 
-        # Get settings
-        add_name = self.settings_manager.get("add_name", True)
-
-        # Determine processor based on file type
-        if worksheet_path.suffix.lower() in self.PDF_FORMATS:
-            processor = PDFProcessor(worksheet_path, add_name=add_name)
-        elif worksheet_path.suffix.lower() in self.IMAGE_FORMATS:
-            processor = ImageProcessor(worksheet_path, add_name=add_name)
-        else:
-            console.print(f"[red]❌ Nicht unterstütztes Format: {worksheet_path.suffix}[/red]")
+        # Students are independent, so render them in parallel when worthwhile
+        if len(students) > 1:
+            self._process_students_parallel(
+                worksheet_path,
+                processor_class,
+                add_name,
+                students,
+                output_folder,
+                progress,
+                task_id
+            )
             return
 
+        processor = processor_class(worksheet_path, add_name=add_name)
+
+        # Look up the extension once per worksheet, not per student
+        suffix = worksheet_path.suffix
+
         # Process for each student
         for student in students:
             try:
                 # Create output filename
-                output_filename = f"{student.name}{worksheet_path.suffix}"
-                output_path = output_folder / output_filename
+                output_path = output_folder / (student.name + suffix)
 
                 # Personalize worksheet
                 processor.personalize_for_student(student, output_path)
@@ -166,6 +252,161 @@ class BatchProcessor:
                 console.print(f"[red]❌ Fehler bei {student.name}: {e}[/red]")
                 logger.error(f"Error processing worksheet for {student.name}: {e}", exc_info=True)
 
+    def _process_students_parallel(
+        self,
+        worksheet_path: Path,
+        processor_class: ProcessorClass,
+        add_name: bool,
+        students: list[Student],
+        output_folder: Path,
+        progress: Progress,
+        task_id: TaskID
+    ) -> None:
+        """Personalize a worksheet for several students using a process pool.
+
+        Uses the shared worker pool if one is running, otherwise a pool just
+        for this worksheet. Each worker builds its processor once per
+        worksheet; progress and error reporting stay on the main process.
+
+        If a worker crashes, the pool breaks and its unfinished students are
+        retried once in a new pool. A broken shared pool is replaced, so
+        later worksheets and groups keep working.
+
+        Args:
+            worksheet_path: Path to the worksheet file
+            processor_class: Processor class for the worksheet format
+            add_name: Whether to add student names
+            students: List of students to personalize for
+            output_folder: Folder to save personalized worksheets
+            progress: Rich progress instance
+            task_id: Progress task ID
+        """
+        # Output paths are plain strings on the main process; the workers
+        # turn them into Path objects
+        output_prefix = os.path.join(output_folder, "")
+
+        def run(executor: ProcessPoolExecutor, batch: list[Student]) -> list[Student]:
+            return self._run_students(
+                executor,
+                worksheet_path,
+                processor_class,
+                add_name,
+                batch,
+                output_prefix,
+                worksheet_path.suffix,
+                progress,
+                task_id,
+            )
+
+        shared = self._executor
+        if shared is not None:
+            unfinished = run(shared, students)
+            if unfinished:
+                self._replace_broken_executor(shared)
+        else:
+            with create_executor(min(len(students), os.cpu_count() or 1)) as executor:
+                unfinished = run(executor, students)
+
+        if not unfinished:
+            return
+
+        logger.warning(
+            f"Worker pool broke, retrying {len(unfinished)} student(s) "
+            f"for {worksheet_path.name}"
+        )
+        with create_executor(min(len(unfinished), os.cpu_count() or 1)) as executor:
+            # A student that breaks the new pool as well is reported as failed
+            for student in run(executor, unfinished):
+                console.print(f"[red]❌ Fehler bei {student.name}: Worker-Prozess abgestürzt[/red]")
+                logger.error(f"Worker process crashed while processing {student.name}")
+
+    def _run_students(
+        self,
+        executor: ProcessPoolExecutor,
+        worksheet_path: Path,
+        processor_class: ProcessorClass,
+        add_name: bool,
+        students: list[Student],
+        output_prefix: str,
+        suffix: str,
+        progress: Progress,
+        task_id: TaskID
+    ) -> list[Student]:
+        """Submit students to a pool and report their results.
+
+        Args:
+            executor: Process pool to run the students in
+            worksheet_path: Path to the worksheet file
+            processor_class: Processor class for the worksheet format
+            add_name: Whether to add student names
+            students: List of students to personalize for
+            output_prefix: Output folder path ending in a separator
+            suffix: Worksheet file extension
+            progress: Rich progress instance
+            task_id: Progress task ID
+
+        Returns:
+            Students that were not processed because the pool broke
+        """
+        futures = {}
+        unfinished: list[Student] = []
+
+        for index, student in enumerate(students):
+            try:
+                future = executor.submit(
+                    personalize_student,
+                    processor_class,
+                    worksheet_path,
+                    add_name,
+                    student,
+                    output_prefix + student.name + suffix,
+                )
+            except BrokenProcessPool:
+                unfinished.extend(students[index:])
+                break
+            futures[future] = student
+
+        # Advance the progress bar in batches to limit re-rendering
+        pending = 0
+
+        for future in as_completed(futures):
+            student = futures[future]
+            try:
+                future.result()
+                pending += 1
+                if pending >= self.PROGRESS_BATCH_SIZE:
+                    progress.update(task_id, advance=pending)
+                    pending = 0
+                logger.info(f"Created personalized worksheet for {student.name}")
+
+            except BrokenProcessPool:
+                unfinished.append(student)
+
+            except Exception as e:
+                console.print(f"[red]❌ Fehler bei {student.name}: {e}[/red]")
+                logger.error(f"Error processing worksheet for {student.name}: {e}", exc_info=True)
+
+        if pending:
+            progress.update(task_id, advance=pending)
+
+        return unfinished
+
+    def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Replace the shared worker pool after one of its workers crashed.
+
+        Groups run in threads, so only the first group to notice the broken
+        pool replaces it.
+
+        Args:
+            broken: The shared pool that broke
+        """
+        with self._executor_lock:
+            if self._executor is not broken:
+                return
+            logger.warning("Worker pool broke, starting a new one")
+            self._executor = create_executor(self._max_workers)
+        broken.shutdown(wait=False)
+
     def _move_processed_worksheet(self, worksheet_path: Path, output_folder: Path) -> None:
         """Move processed worksheet from Input to Output folder.
 
@@ -175,17 +416,39 @@ class BatchProcessor:
         """
         try:
             target_path = output_folder / worksheet_path.name
-            shutil.move(str(worksheet_path), str(target_path))
+            try:
+                # Single rename syscall when Input and Ausgabe share a filesystem
+                os.replace(worksheet_path, target_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(os.fspath(worksheet_path), os.fspath(target_path))
             logger.info(f"Moved {worksheet_path.name} to {output_folder}")
         except Exception as e:
             console.print(f"[yellow]⚠️  Konnte {worksheet_path.name} nicht verschieben: {e}[/yellow]")
             logger.error(f"Error moving worksheet: {e}", exc_info=True)
 
-    def process_group(self, group: str) -> None:
+    def _create_progress(self) -> Progress:
+        """Create the progress display used for worksheet processing.
+
+        Returns:
+            Rich progress instance
+        """
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            refresh_per_second=4,
+        )
+
+    def process_group(self, group: str, progress: Optional[Progress] = None) -> None:
         """Process all worksheets for a specific group.
 
         Args:
             group: Group identifier (A, B, or C)
+            progress: Shared progress display; a new one is created if None
         """
         input_folder, students_folder, output_folder = self._get_folder_paths(group)
 
@@ -196,8 +459,7 @@ class BatchProcessor:
             console.print(f"[yellow]⚠️  Input-Ordner nicht gefunden: {input_folder}[/yellow]")
             return
 
-        if not output_folder.exists():
-            output_folder.mkdir(parents=True, exist_ok=True)
+        output_folder.mkdir(parents=True, exist_ok=True)
 
         # Load students
         students = self._load_students(students_folder)
@@ -206,60 +468,135 @@ class BatchProcessor:
             console.print(f"[yellow]⚠️  Keine Schülerfotos gefunden in {students_folder}[/yellow]")
             return
 
-        # Find all worksheets in Input folder
-        worksheets = [
-            f for f in input_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in self.SUPPORTED_FORMATS
-        ]
+        console.print(f"[green]✓ Gruppe {group}: {len(students)} Schüler gefunden[/green]")
+
+        # Settings do not change during a batch, so read them once per group
+        add_name = self.settings_manager.get("add_name", True)
+
+        # Worksheets are streamed from the Input folder while they are processed
+        worksheets = self._iter_worksheets(input_folder)
 
-        if not worksheets:
+        if progress is None:
+            with self._create_progress() as progress:
+                processed = self._process_worksheets(
+                    worksheets, students, output_folder, progress, add_name
+                )
+        else:
+            processed = self._process_worksheets(
+                worksheets, students, output_folder, progress, add_name
+            )
+
+        if not processed:
             console.print(f"[yellow]⚠️  Keine Arbeitsblätter gefunden in {input_folder}[/yellow]")
             return
 
-        console.print(f"[green]✓ {len(students)} Schüler gefunden[/green]")
-        console.print(f"[green]✓ {len(worksheets)} Arbeitsblatt/Arbeitsblätter gefunden[/green]")
+        console.print(f"[green]✓ Gruppe {group}: {processed} Arbeitsblatt/Arbeitsblätter verarbeitet[/green]")
 
-        # Process each worksheet
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
+    def _iter_worksheets(
+        self, input_folder: Path
+    ) -> Iterator[tuple[Path, ProcessorClass]]:
+        """Lazily yield the supported worksheet files of an Input folder.
 
-            for worksheet_path in worksheets:
-                worksheet_name = worksheet_path.stem
-                output_subfolder = self._create_output_folder(output_folder, worksheet_name)
+        Args:
+            input_folder: Path to the Input folder
 
-                task_id = progress.add_task(
-                    f"[cyan]Verarbeite {worksheet_path.name}...",
-                    total=len(students)
-                )
+        Yields:
+            Tuple of (worksheet path, processor class for its format)
+        """
+        processor_by_format = self.PROCESSOR_BY_FORMAT
+        for record in _scan_files(input_folder, processor_by_format.keys()):
+            yield Path(record.path), processor_by_format[record.extension]
 
-                self._process_worksheet(
-                    worksheet_path,
-                    students,
-                    output_subfolder,
-                    progress,
-                    task_id
-                )
+    def _process_worksheets(
+        self,
+        worksheets: Iterable[tuple[Path, ProcessorClass]],
+        students: list[Student],
+        output_folder: Path,
+        progress: Progress,
+        add_name: bool
+    ) -> int:
+        """Process each worksheet of a group for all students.
 
-                # Keep original worksheet in Input folder (don't move)
-                # self._move_processed_worksheet(worksheet_path, output_subfolder)
+        Args:
+            worksheets: Worksheet files with their processor classes
+            students: List of students to personalize for
+            output_folder: Base output folder of the group
+            progress: Rich progress instance
+            add_name: Whether to add student names
 
-                console.print(f"[green]✓ {worksheet_path.name} fertig![/green]")
+        Returns:
+            Number of processed worksheets
+        """
+        processed = 0
+
+        # One progress task per group; its total grows as worksheets are found
+        task_id = progress.add_task("[cyan]Suche Arbeitsblätter...", total=None)
+        total = 0
+
+        for worksheet_path, processor_class in worksheets:
+            worksheet_name = worksheet_path.stem
+            output_subfolder = self._create_output_folder(output_folder, worksheet_name)
+
+            total += len(students)
+            progress.update(
+                task_id,
+                total=total,
+                description=f"[cyan]Verarbeite {worksheet_path.name}...",
+            )
+
+            self._process_worksheet(
+                worksheet_path,
+                processor_class,
+                students,
+                output_subfolder,
+                progress,
+                task_id,
+                add_name
+            )
+
+            # Keep original worksheet in Input folder (don't move)
+            # self._move_processed_worksheet(worksheet_path, output_subfolder)
+
+            console.print(f"[green]✓ {worksheet_path.name} fertig![/green]")
+            processed += 1
+
+        if not processed:
+            progress.remove_task(task_id)
+
+        return processed
 
     def process_all_groups(self) -> None:
-        """Process all groups (A, B, C)."""
+        """Process all groups (A, B, C).
+
+        The groups use disjoint folders, so they are processed concurrently
+        and share a single progress display.
+        """
         console.print("\n[bold green]🚀 Starte Batch-Verarbeitung[/bold green]\n")
 
-        for group in self.groups:
-            try:
-                self.process_group(group)
-            except Exception as e:
-                console.print(f"[red]❌ Fehler bei Gruppe {group}: {e}[/red]")
-                logger.error(f"Error processing group {group}: {e}", exc_info=True)
+        # Start and warm up the workers while the groups scan their folders
+        self._executor = create_executor(self._max_workers)
+        for _ in range(self._max_workers):
+            self._executor.submit(_warm_up_worker)
+
+        try:
+            with self._create_progress() as progress, ThreadPoolExecutor(
+                max_workers=len(self.groups)
+            ) as executor:
+                futures = {
+                    executor.submit(self.process_group, group, progress): group
+                    for group in self.groups
+                }
+
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        console.print(f"[red]❌ Fehler bei Gruppe {group}: {e}[/red]")
+                        logger.error(f"Error processing group {group}: {e}", exc_info=True)
+        finally:
+            self._executor.shutdown()
+            self._executor = None
 
         console.print("\n[bold green]✅ Batch-Verarbeitung abgeschlossen![/bold green]\n")
 
@@ -4,8 +4,12 @@ This module defines configuration settings, constants, and logging setup
 for the worksheet personalizer application.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +28,10 @@ A4_HEIGHT_CM: float = 29.7  # DIN A4 height in centimeters
 DPI_PDF: int = 72  # Standard PDF DPI (PostScript points)
 DPI_IMAGE: int = 1200  # Maximum quality image DPI for professional printing
 
+# Encoder settings for personalized image worksheets
+PNG_COMPRESS_LEVEL: int = 1  # zlib level: much faster than Pillow's 6, slightly larger files
+JPEG_QUALITY: int = 90  # JPEG quality (no optimize/progressive pass)
+
 # Font settings
 FONT_NAME: str = "Helvetica"  # Default font for PDF text
 FONT_SIZE: int = 12  # Default font size in points
@@ -60,40 +68,85 @@ class Settings(BaseSettings):
     add_name_default: bool = Field(default=False)
 
 
-def setup_logging(level: Optional[str] = None) -> None:
+# Whether setup_logging has already configured the root logger
+_LOGGING_CONFIGURED = False
+
+
+def setup_logging(level: Optional[str] = None, background: bool = True) -> None:
     """Configure logging for the application.
 
+    Log records are handed to a queue and written to stdout by a
+    background listener thread. Logging is only configured once per
+    process. Later calls without a level return immediately; later calls
+    with a level only change the root logger's level.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                If None, uses the level from Settings.
+        background: Write records from a listener thread. Worker processes
+               pass False: they exit without running atexit handlers, so
+               queued records would be lost.
 
     Example:
         >>> setup_logging("DEBUG")
         >>> logging.info("This is an info message")
     """
+    global _LOGGING_CONFIGURED
+
+    if _LOGGING_CONFIGURED and level is None:
+        return
+
     if level is None:
-        settings = Settings()
+        settings = get_settings()
         level = settings.log_level
 
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level,
-        format="[%(levelname)s] %(asctime)s - %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout,
+    if _LOGGING_CONFIGURED:
+        logging.getLogger().setLevel(numeric_level)
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter(
+            "[%(levelname)s] %(asctime)s - %(name)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     )
+    handler: logging.Handler = stream_handler
+
+    if background:
+        # Records are only queued by the logging call; a background listener
+        # writes them to stdout so callers never wait on the stream lock
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # The queue handler only merges the arguments into the message; the
+        # full format is applied by the stream handler
+        handler = QueueHandler(log_queue)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Configure root logger
+    logging.basicConfig(level=numeric_level, handlers=[handler])
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("PIL").setLevel(logging.WARNING)
     logging.getLogger("reportlab").setLevel(logging.WARNING)
 
+    _LOGGING_CONFIGURED = True
+
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the application settings instance.
 
+    The settings are read from the environment and .env file only once per
+    process. Call ``get_settings.cache_clear()`` after changing environment
+    variables (e.g. in tests) to reload them.
+
     Returns:
         Settings instance with values from environment variables or defaults
     """
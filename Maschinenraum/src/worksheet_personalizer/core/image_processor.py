@@ -5,26 +5,32 @@ for image manipulation and compositing.
 """
 
 import logging
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Literal, Union
+from typing import Any, Callable, Literal, NamedTuple, Optional, cast
 
 from PIL import Image
-from PIL.ImageFont import FreeTypeFont
-from PIL.ImageFont import ImageFont as ImageFontType
 
 from worksheet_personalizer.config import (
     DPI_IMAGE,
     FONT_SIZE,
+    JPEG_QUALITY,
     PHOTO_MARGIN_CM,
     PHOTO_SIZE_CM,
+    PNG_COMPRESS_LEVEL,
 )
+from worksheet_personalizer.core.parallel import personalize_batch
 from worksheet_personalizer.models.student import Student
-from worksheet_personalizer.settings_manager import SettingsManager
+from worksheet_personalizer.settings_manager import get_settings_manager
+from worksheet_personalizer.utils.file_handler import atomic_output
 from worksheet_personalizer.utils.image_utils import (
     cm_to_pixels,
     ensure_rgb,
+    load_font,
     render_text_on_image,
-    scale_photo,
+    scaled_student_photo,
+    text_bbox,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,19 @@ logger = logging.getLogger(__name__)
 NamePosition = Literal["beside_photo", "center", "left", "right"]
 
 
+class _NameLayout(NamedTuple):
+    """Measurements (in pixels) needed to place a student's name."""
+
+    text_width: int
+    text_height: int
+    photo_x: int
+    photo_y: int
+    photo_height: int
+    worksheet_width: int
+    margin: int
+    font_size: int
+
+
 class ImageProcessor:
     """Handles personalization of image worksheets with student photos and names.
 
@@ -69,16 +88,80 @@ class ImageProcessor:
         self.worksheet_path = worksheet_path
         self.add_name = add_name
 
-        # Load settings from settings manager
-        self.settings_manager = SettingsManager()
-        self.photo_size_cm = self.settings_manager.get("photo_size_cm", PHOTO_SIZE_CM)
-        self.photo_margin_cm = self.settings_manager.get("photo_margin_cm", PHOTO_MARGIN_CM)
-        self.font_size = self.settings_manager.get("font_size", FONT_SIZE)
-        self.name_position: NamePosition = self.settings_manager.get("name_position", "beside_photo")
+        # Decoded worksheet, shared by all students (see prepare_template)
+        self._template: Optional[Image.Image] = None
+
+        # Settings are read lazily from the settings manager (see properties below)
+        self.settings_manager = get_settings_manager()
 
         logger.info(f"Initialized image processor for: {worksheet_path.name}")
-        logger.debug(f"Settings: photo_size={self.photo_size_cm}cm, margin={self.photo_margin_cm}cm, "
-                    f"font_size={self.font_size}, name_position={self.name_position}")
+
+    @cached_property
+    def photo_size_cm(self) -> float:
+        """Photo size (long side) in centimeters."""
+        return float(self.settings_manager.get("photo_size_cm", PHOTO_SIZE_CM))
+
+    @cached_property
+    def photo_margin_cm(self) -> float:
+        """Margin of the photo from the top-right corner in centimeters."""
+        return float(self.settings_manager.get("photo_margin_cm", PHOTO_MARGIN_CM))
+
+    @cached_property
+    def font_size(self) -> int:
+        """Font size for the student name in points (only used with add_name)."""
+        return int(self.settings_manager.get("font_size", FONT_SIZE))
+
+    @cached_property
+    def name_position(self) -> NamePosition:
+        """Where to place the student name (only used with add_name)."""
+        return cast(
+            NamePosition, self.settings_manager.get("name_position", "beside_photo")
+        )
+
+    @cached_property
+    def _place_name(self) -> Callable[[_NameLayout], tuple[int, int]]:
+        """Name placement function for the name_position setting.
+
+        Raises:
+            ValueError: If name_position is unknown
+        """
+        placements: dict[str, Callable[[_NameLayout], tuple[int, int]]] = {
+            "beside_photo": self._name_beside_photo,
+            "center": self._name_center,
+            "left": self._name_left,
+            "right": self._name_right,
+        }
+        try:
+            return placements[self.name_position]
+        except KeyError:
+            raise ValueError(f"Unknown name position: {self.name_position}") from None
+
+    @staticmethod
+    def _name_beside_photo(layout: _NameLayout) -> tuple[int, int]:
+        """To the left of the photo, vertically centered on it."""
+        name_margin = 10  # Small margin from photo edge
+        return (
+            layout.photo_x - name_margin - layout.text_width,
+            layout.photo_y + (layout.photo_height // 2) - (layout.text_height // 2),
+        )
+
+    @staticmethod
+    def _name_center(layout: _NameLayout) -> tuple[int, int]:
+        """Center of the page."""
+        return (layout.worksheet_width - layout.text_width) // 2, layout.margin
+
+    @staticmethod
+    def _name_left(layout: _NameLayout) -> tuple[int, int]:
+        """Left side of the page."""
+        return layout.margin, layout.margin
+
+    @staticmethod
+    def _name_right(layout: _NameLayout) -> tuple[int, int]:
+        """Right side of the page (above photo)."""
+        return (
+            layout.worksheet_width - layout.text_width - layout.margin,
+            layout.photo_y - layout.font_size - 10,  # 10 pixels above photo
+        )
 
     def _load_worksheet(self) -> Image.Image:
         """Load the worksheet image and preserve DPI information.
@@ -109,115 +192,159 @@ class ImageProcessor:
         except Exception as e:
             raise ValueError(f"Error loading worksheet image: {e}") from e
 
-    def personalize_for_student(self, student: Student, output_path: Path) -> None:
-        """Create a personalized worksheet for a specific student.
+    def prepare_template(self) -> None:
+        """Decode the worksheet once so it can be reused for every student.
 
-        Args:
-            student: Student object with name and photo
-            output_path: Path where the personalized image will be saved
+        Each personalization works on a copy of the cached template, so the
+        worksheet file is only read and converted a single time.
 
         Raises:
-            ValueError: If personalization fails
-            IOError: If file cannot be written
+            ValueError: If image cannot be loaded
         """
-        logger.info(f"Personalizing worksheet for: {student.name}")
+        worksheet = ensure_rgb(self._load_worksheet())  # Ensure RGB mode for compositing
+        worksheet.load()
+        self._template = worksheet
 
-        try:
-            # Load worksheet
-            worksheet = self._load_worksheet()
-            worksheet = ensure_rgb(worksheet)  # Ensure RGB mode for compositing
+    def _draw_student(
+        self,
+        worksheet: Image.Image,
+        student: Student,
+        touched: list[tuple[tuple[int, int, int, int], Image.Image]],
+    ) -> None:
+        """Draw a student's photo and optional name onto the worksheet.
 
-            # Load and process student photo
-            photo = Image.open(student.photo_path)
-            photo = ensure_rgb(photo)
-            photo = scale_photo(photo, self.photo_size_cm, self._worksheet_dpi)
+        Before each region is drawn on, its original pixels are appended to
+        touched so the caller can restore the worksheet afterwards.
 
-            # Calculate position (top-right with margin)
-            margin_pixels = cm_to_pixels(self.photo_margin_cm, self._worksheet_dpi)
-            photo_width, photo_height = photo.size
-            worksheet_width, worksheet_height = worksheet.size
-
-            x_position = worksheet_width - photo_width - margin_pixels
-            y_position = margin_pixels
+        Args:
+            worksheet: Worksheet image to draw on (modified in place)
+            student: Student object with name and photo
+            touched: List receiving (box, original pixels) of changed regions
+        """
+        # Load and scale student photo (cached across worksheets)
+        photo = scaled_student_photo(
+            str(student.photo_path),
+            student.photo_path.stat().st_mtime,
+            self.photo_size_cm,
+            self._worksheet_dpi,
+        )
+
+        # Calculate position (top-right with margin)
+        margin_pixels = cm_to_pixels(self.photo_margin_cm, self._worksheet_dpi)
+        photo_width, photo_height = photo.size
+        worksheet_width, worksheet_height = worksheet.size
+
+        x_position = worksheet_width - photo_width - margin_pixels
+        y_position = margin_pixels
+
+        # Paste photo onto worksheet
+        photo_box = (x_position, y_position, x_position + photo_width, y_position + photo_height)
+        touched.append((photo_box, worksheet.crop(photo_box)))
+        worksheet.paste(photo, (x_position, y_position))
+
+        logger.debug(
+            f"Pasted photo at position ({x_position}, {y_position}), "
+            f"size {photo_width}x{photo_height} pixels"
+        )
+
+        # Add student name if requested
+        if self.add_name:
+            # Scale font size based on DPI
+            scaled_font_size = int(self.font_size * (self._worksheet_dpi / 72))
+
+            # Get text bounding box to calculate width (font and
+            # measurements are cached)
+            font = load_font(scaled_font_size)
+            bbox = text_bbox(font, student.name)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+
+            # Calculate position based on name_position setting
+            text_x, text_y = self._place_name(
+                _NameLayout(
+                    text_width,
+                    text_height,
+                    x_position,
+                    y_position,
+                    photo_height,
+                    worksheet_width,
+                    margin_pixels,
+                    scaled_font_size,
+                )
+            )
 
-            # Paste photo onto worksheet
-            worksheet.paste(photo, (x_position, y_position))
+            # Render the name (with a little slack for anti-aliasing)
+            text_box = (
+                text_x + bbox[0] - 2,
+                text_y + bbox[1] - 2,
+                text_x + bbox[2] + 2,
+                text_y + bbox[3] + 2,
+            )
+            touched.append((text_box, worksheet.crop(text_box)))
+            render_text_on_image(
+                worksheet,
+                student.name,
+                (text_x, text_y),
+                font_size=scaled_font_size,
+            )
 
             logger.debug(
-                f"Pasted photo at position ({x_position}, {y_position}), "
-                f"size {photo_width}x{photo_height} pixels"
+                f"Added name '{student.name}' at position {self.name_position} ({text_x}, {text_y})"
             )
 
-            # Add student name if requested
-            if self.add_name:
-                # Scale font size based on DPI
-                scaled_font_size = int(self.font_size * (self._worksheet_dpi / 72))
-
-                from PIL import ImageDraw, ImageFont
-
-                # Create a temporary draw object to measure text
-                draw = ImageDraw.Draw(worksheet)
-                font: Union[FreeTypeFont, ImageFontType]
-                try:
-                    font = ImageFont.truetype("Arial.ttf", scaled_font_size)
-                except OSError:
-                    try:
-                        font = ImageFont.truetype("DejaVuSans.ttf", scaled_font_size)
-                    except OSError:
-                        font = ImageFont.load_default()
-                        logger.warning("Using default font for name rendering")
-
-                # Get text bounding box to calculate width
-                bbox = draw.textbbox((0, 0), student.name, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-
-                # Calculate position based on name_position setting
-                if self.name_position == "beside_photo":
-                    # To the left of the photo
-                    name_margin = 10  # Small margin from photo edge
-                    text_x = x_position - name_margin - text_width
-                    text_y = y_position + (photo_height // 2) - (text_height // 2)
-
-                elif self.name_position == "center":
-                    # Center of the page
-                    text_x = (worksheet_width - text_width) // 2
-                    text_y = margin_pixels
-
-                elif self.name_position == "left":
-                    # Left side of the page
-                    text_x = margin_pixels
-                    text_y = margin_pixels
-
-                elif self.name_position == "right":
-                    # Right side of the page (above photo)
-                    text_x = worksheet_width - text_width - margin_pixels
-                    text_y = y_position - scaled_font_size - 10  # 10 pixels above photo
-
-                # Render the name
-                render_text_on_image(
-                    worksheet,
-                    student.name,
-                    (text_x, text_y),
-                    font_size=scaled_font_size,
-                )
+    def _save_worksheet(self, worksheet: Image.Image, output_path: Path) -> None:
+        """Save a personalized worksheet, preserving format and DPI.
 
-                logger.debug(
-                    f"Added name '{student.name}' at position {self.name_position} ({text_x}, {text_y})"
-                )
+        Args:
+            worksheet: Personalized worksheet image
+            output_path: Path where the image will be saved
+        """
+        save_kwargs: dict[str, Any] = {
+            "dpi": (self._worksheet_dpi, self._worksheet_dpi)
+        }
+
+        # Determine output format from extension
+        output_format = output_path.suffix.lower().replace(".", "").upper()
+        if output_format == "JPG":
+            output_format = "JPEG"
 
-            # Save the personalized worksheet
-            # Preserve original format and DPI
-            save_kwargs: dict[str, Any] = {
-                "dpi": (self._worksheet_dpi, self._worksheet_dpi)
-            }
+        # Fast encoder settings: each file is written once per student
+        if output_format == "PNG":
+            save_kwargs["compress_level"] = PNG_COMPRESS_LEVEL
+        elif output_format == "JPEG":
+            save_kwargs.update(quality=JPEG_QUALITY, optimize=False, progressive=False)
 
-            # Determine output format from extension
-            output_format = output_path.suffix.lower().replace(".", "").upper()
-            if output_format == "JPG":
-                output_format = "JPEG"
+        with atomic_output(output_path) as tmp_path:
+            worksheet.save(tmp_path, format=output_format, **save_kwargs)
 
-            worksheet.save(output_path, format=output_format, **save_kwargs)
+    def personalize_for_student(self, student: Student, output_path: Path) -> None:
+        """Create a personalized worksheet for a specific student.
+
+        Args:
+            student: Student object with name and photo
+            output_path: Path where the personalized image will be saved
+
+        Raises:
+            ValueError: If personalization fails
+            IOError: If file cannot be written
+        """
+        logger.info(f"Personalizing worksheet for: {student.name}")
+
+        try:
+            # Draw directly on the cached worksheet instead of copying the
+            # whole page; the touched regions are restored after saving
+            if self._template is None:
+                self.prepare_template()
+            assert self._template is not None
+            worksheet = self._template
+            touched: list[tuple[tuple[int, int, int, int], Image.Image]] = []
+
+            try:
+                self._draw_student(worksheet, student, touched)
+                self._save_worksheet(worksheet, output_path)
+            finally:
+                for box, original in reversed(touched):
+                    worksheet.paste(original, box)
 
             logger.info(f"Created personalized image: {output_path}")
 
@@ -225,3 +352,31 @@ class ImageProcessor:
             raise ValueError(
                 f"Error personalizing worksheet for {student.name}: {e}"
             ) from e
+
+    def personalize_batch(
+        self,
+        students: Sequence[Student],
+        output_paths: Sequence[Path],
+        max_workers: Optional[int] = None,
+    ) -> list[tuple[Student, Exception]]:
+        """Create personalized worksheets for many students in parallel.
+
+        Each worker process builds its own processor for this worksheet
+        (reading the current settings), so only paths and students are sent
+        to the workers.
+
+        Args:
+            students: Students to personalize for
+            output_paths: Output path for each student (same order as students)
+            max_workers: Number of worker processes (default: min(students, CPUs))
+
+        Returns:
+            List of (student, error) for every student that failed
+
+        Raises:
+            ValueError: If students and output_paths differ in length
+        """
+        return personalize_batch(
+            type(self), self.worksheet_path, self.add_name,
+            students, output_paths, max_workers,
+        )
@@ -0,0 +1,180 @@
+"""Parallel personalization of worksheets in worker processes.
+
+Each student is personalized independently, so students are dispatched to
+a process pool. Workers only receive the worksheet path, the student and
+the output path; processors (with their cached templates) are rebuilt and
+reused inside each worker instead of being pickled.
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from worksheet_personalizer.config import setup_logging
+from worksheet_personalizer.models.student import Student
+
+if TYPE_CHECKING:
+    from worksheet_personalizer.core.image_processor import ImageProcessor
+    from worksheet_personalizer.core.pdf_processor import PDFProcessor
+
+    Processor = Union[PDFProcessor, ImageProcessor]
+
+logger = logging.getLogger(__name__)
+
+# Processors of the current worker process, keyed by (worksheet, add_name)
+_worker_processors: "OrderedDict[tuple[Path, bool], Processor]" = OrderedDict()
+
+# Number of worksheet processors kept per worker. Each one holds a decoded
+# template (hundreds of MB for a 1200 DPI image), and pools run one worker
+# per CPU, so only the current worksheet's processor is kept
+_WORKER_CACHE_SIZE = 1
+
+
+def _get_worker_processor(
+    processor_class: "type[Processor]", worksheet_path: Path, add_name: bool
+) -> "Processor":
+    """Get the worker's processor for a worksheet, creating it on first use.
+
+    Args:
+        processor_class: Processor class for the worksheet format
+        worksheet_path: Path to the worksheet file
+        add_name: Whether to add student names
+
+    Returns:
+        PDFProcessor or ImageProcessor for the worksheet
+    """
+    key = (worksheet_path, add_name)
+    processor = _worker_processors.get(key)
+
+    if processor is None:
+        # Evict first, so the old template is released before the new one
+        # is decoded
+        while len(_worker_processors) >= _WORKER_CACHE_SIZE:
+            _worker_processors.popitem(last=False)
+        processor = processor_class(worksheet_path, add_name=add_name)
+        _worker_processors[key] = processor
+    else:
+        _worker_processors.move_to_end(key)
+
+    return processor
+
+
+def personalize_student(
+    processor_class: "type[Processor]",
+    worksheet_path: Path,
+    add_name: bool,
+    student: Student,
+    output_path: str,
+) -> None:
+    """Personalize a worksheet for a single student in a worker process.
+
+    Args:
+        processor_class: Processor class for the worksheet format
+        worksheet_path: Path to the worksheet file
+        add_name: Whether to add student names
+        student: Student to personalize for
+        output_path: Path where the personalized worksheet will be saved
+    """
+    processor = _get_worker_processor(processor_class, worksheet_path, add_name)
+    processor.personalize_for_student(student, Path(output_path))
+
+
+def _init_worker(log_level: str) -> None:
+    """Configure logging in a new worker process.
+
+    Spawned workers start with unconfigured logging, so without this their
+    log records would be dropped. Records are written directly, because
+    workers exit without stopping a background listener.
+
+    Args:
+        log_level: Level of the parent's root logger
+    """
+    setup_logging(log_level, background=False)
+
+
+def create_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create a process pool for personalizing students.
+
+    Workers log to stdout at the level of the parent's root logger.
+
+    Args:
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Process pool executor
+    """
+    log_level = logging.getLevelName(logging.getLogger().getEffectiveLevel())
+
+    # Callers may run in threads, so workers must not be forked from them
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(log_level,),
+    )
+
+
+def personalize_batch(
+    processor_class: "type[Processor]",
+    worksheet_path: Path,
+    add_name: bool,
+    students: Sequence[Student],
+    output_paths: Sequence[Path],
+    max_workers: Optional[int] = None,
+) -> list[tuple[Student, Exception]]:
+    """Personalize a worksheet for many students in parallel.
+
+    Args:
+        processor_class: Processor class for the worksheet format
+        worksheet_path: Path to the worksheet file
+        add_name: Whether to add student names
+        students: Students to personalize for
+        output_paths: Output path for each student (same order as students)
+        max_workers: Number of worker processes (default: min(students, CPUs))
+
+    Returns:
+        List of (student, error) for every student that failed
+
+    Raises:
+        ValueError: If students and output_paths differ in length
+    """
+    if len(students) != len(output_paths):
+        raise ValueError(
+            f"Got {len(students)} students but {len(output_paths)} output paths"
+        )
+
+    if not students:
+        return []
+
+    if max_workers is None:
+        max_workers = min(len(students), os.cpu_count() or 1)
+
+    errors: list[tuple[Student, Exception]] = []
+
+    with create_executor(max_workers) as executor:
+        futures = {
+            executor.submit(
+                personalize_student,
+                processor_class,
+                worksheet_path,
+                add_name,
+                student,
+                os.fspath(output_path),
+            ): student
+            for student, output_path in zip(students, output_paths)
+        }
+
+        for future in as_completed(futures):
+            student = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error personalizing worksheet for {student.name}: {e}")
+                errors.append((student, e))
+
+    return errors
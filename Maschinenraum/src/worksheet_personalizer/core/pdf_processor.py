@@ -4,13 +4,22 @@ This module handles PDF-specific worksheet personalization using PyPDF2
 for reading/writing PDFs and reportlab for creating overlays.
 """
 
+import functools
 import io
 import logging
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Literal
+from typing import Any, Callable, Literal, Optional, cast
 
 from PIL import Image
-from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2 import PageObject, PdfReader, PdfWriter
+from PyPDF2.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+)
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
@@ -22,11 +31,14 @@ from worksheet_personalizer.config import (
     DPI_PDF,
     PHOTO_SIZE_CM,
 )
+from worksheet_personalizer.core.parallel import personalize_batch
 from worksheet_personalizer.models.student import Student
-from worksheet_personalizer.settings_manager import SettingsManager
+from worksheet_personalizer.settings_manager import get_settings_manager
+from worksheet_personalizer.utils.file_handler import atomic_output
 from worksheet_personalizer.utils.image_utils import (
     cm_to_pixels,
     ensure_rgb,
+    load_student_photo,
     scale_photo,
 )
 
@@ -34,8 +46,8 @@ logger = logging.getLogger(__name__)
 
 NamePosition = Literal["beside_photo", "center", "left", "right"]
 
-# Register Norddruck font
-_NORDDRUCK_REGISTERED = False
+# Register Norddruck font (resolved font name, set on first registration attempt)
+_NORDDRUCK_FONT_NAME: Optional[str] = None
 
 def _register_norddruck_font() -> str:
     """Register Norddruck font with ReportLab.
@@ -44,13 +56,16 @@ def _register_norddruck_font() -> str:
     The original font had characters mapped to Private Use Area (U+F000+)
     which has been remapped to standard Unicode positions.
 
+    The font file is only looked up once per process; the fallback is
+    remembered as well so a missing font is not retried for every worksheet.
+
     Returns:
         Font name to use ('Norddruck' or 'Helvetica-Bold' as fallback)
     """
-    global _NORDDRUCK_REGISTERED
+    global _NORDDRUCK_FONT_NAME
 
-    if _NORDDRUCK_REGISTERED:
-        return 'Norddruck'
+    if _NORDDRUCK_FONT_NAME is not None:
+        return _NORDDRUCK_FONT_NAME
 
     try:
         # Get path to rebuilt font file in package
@@ -58,15 +73,123 @@ def _register_norddruck_font() -> str:
 
         if font_path.exists():
             pdfmetrics.registerFont(TTFont('Norddruck', str(font_path)))
-            _NORDDRUCK_REGISTERED = True
+            _NORDDRUCK_FONT_NAME = 'Norddruck'
             logger.info(f"Norddruck font registered successfully from {font_path.name}")
-            return 'Norddruck'
         else:
             logger.warning(f"Norddruck font not found at {font_path}, using Helvetica-Bold")
-            return 'Helvetica-Bold'
+            _NORDDRUCK_FONT_NAME = 'Helvetica-Bold'
     except Exception as e:
         logger.warning(f"Could not register Norddruck font: {e}, using Helvetica-Bold")
-        return 'Helvetica-Bold'
+        _NORDDRUCK_FONT_NAME = 'Helvetica-Bold'
+
+    return _NORDDRUCK_FONT_NAME
+
+
+# Font for student names, registered once per process when the module is
+# imported (this includes every worker process of a pool)
+PDF_FONT_NAME = _register_norddruck_font()
+
+
+def _draw_photo(
+    c: canvas.Canvas,
+    photo: Image.Image,
+    page_width: float,
+    page_height: float,
+    margin_right: float,
+    margin_top: float,
+    photo_size_points: float,
+) -> tuple[float, float]:
+    """Draw a photo in the top-right corner of an overlay canvas.
+
+    Args:
+        c: Canvas of the overlay PDF
+        photo: Student photo in RGB mode
+        page_width: Page width in points
+        page_height: Page height in points
+        margin_right: Distance from the right edge in points
+        margin_top: Distance from the top edge in points
+        photo_size_points: Display size of the long side in points
+
+    Returns:
+        Tuple of (x, y) of the photo's lower-left corner in points
+    """
+    # Keep original resolution - don't scale the pixels!
+    # We only scale the display size in the PDF
+    original_width, original_height = photo.size
+
+    # Hand the decoded photo to ReportLab directly (lossless, no
+    # intermediate encode/decode roundtrip)
+    photo_reader = ImageReader(photo)
+
+    # Maintain aspect ratio for display size
+    aspect_ratio = original_width / original_height
+    if original_width >= original_height:
+        photo_width = photo_size_points
+        photo_height = photo_size_points / aspect_ratio
+    else:
+        photo_height = photo_size_points
+        photo_width = photo_size_points * aspect_ratio
+
+    x_position = page_width - photo_width - margin_right
+    y_position = page_height - photo_height - margin_top
+
+    # Draw photo
+    c.drawImage(
+        photo_reader,
+        x_position,
+        y_position,
+        width=photo_width,
+        height=photo_height,
+        preserveAspectRatio=True,
+    )
+
+    logger.debug(
+        f"Added photo at position ({x_position:.1f}, {y_position:.1f}), "
+        f"size {photo_width}x{photo_height} points"
+    )
+
+    return x_position, y_position
+
+
+@functools.lru_cache(maxsize=4)
+def _build_photo_only_overlay(
+    page_width: float,
+    page_height: float,
+    margin_right: float,
+    margin_top: float,
+    photo_size_points: float,
+    photo_path: str,
+    mtime: float,
+) -> bytes:
+    """Build an overlay PDF that only contains a photo.
+
+    Cached per page geometry and photo (including its modification time),
+    so a photo used on several worksheets of the same size is only drawn
+    and serialized once per process. Each entry holds an uncompressed
+    full-resolution photo, so only a few overlays are kept.
+
+    Args:
+        page_width: Page width in points
+        page_height: Page height in points
+        margin_right: Distance from the right edge in points
+        margin_top: Distance from the top edge in points
+        photo_size_points: Display size of the long side in points
+        photo_path: Path to the photo file
+        mtime: Modification time of the photo file
+
+    Returns:
+        Overlay PDF bytes
+    """
+    with Image.open(photo_path) as photo:
+        photo.load()
+        rgb_photo = ensure_rgb(photo)
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
+    c.setPageCompression(0)  # Disable compression for maximum image quality
+    _draw_photo(c, rgb_photo, page_width, page_height, margin_right, margin_top, photo_size_points)
+    c.save()
+    return buffer.getvalue()
 
 
 class PDFProcessor:
@@ -100,11 +223,18 @@ class PDFProcessor:
         self.worksheet_path = worksheet_path
         self.add_name = add_name
 
-        # Register and get font name
-        self.font_name = _register_norddruck_font()
+        # Raw worksheet bytes and page size, shared by all students
+        # (see prepare_template)
+        self._template_bytes: Optional[bytes] = None
+        self._page_dimensions: Optional[tuple[float, float]] = None
+        self._reader: Optional[PdfReader] = None
+        self._effective_dpi: Optional[float] = None
+
+        # Font registered at import time
+        self.font_name = PDF_FONT_NAME
 
         # Load settings from settings manager
-        self.settings_manager = SettingsManager()
+        self.settings_manager = get_settings_manager()
         self.photo_size_cm = self.settings_manager.get("photo_size_cm", PHOTO_SIZE_CM)
 
         # Get font_size from settings or calculate dynamically
@@ -126,9 +256,53 @@ class PDFProcessor:
                     f"name_position={self.name_position}, photo_top={self.photo_top_margin_percent}%, "
                     f"photo_right={self.photo_right_margin_percent}%, name_top={self.name_top_margin_percent}%")
 
+    def prepare_template(self) -> None:
+        """Read the worksheet once so it can be reused for every student.
+
+        The PDF is parsed once and the reader, first-page dimensions and
+        effective DPI are cached for all students. Reader pages are never
+        modified; overlays are merged onto the writer's copies.
+
+        Raises:
+            ValueError: If PDF cannot be read or has no pages
+        """
+        try:
+            self._template_bytes = self.worksheet_path.read_bytes()
+            self._reader = PdfReader(io.BytesIO(self._template_bytes))
+        except Exception as e:
+            raise ValueError(f"Error reading PDF: {e}") from e
+
+        self._page_dimensions = self._read_page_dimensions()
+        self._effective_dpi = None
+
+    def _open_worksheet(self) -> PdfReader:
+        """Get the shared reader on the cached worksheet bytes.
+
+        Returns:
+            PdfReader for the worksheet
+        """
+        if self._reader is None:
+            self.prepare_template()
+        assert self._reader is not None
+        return self._reader
+
     def _get_page_dimensions(self) -> tuple[float, float]:
         """Get the dimensions of the first page in the PDF.
 
+        Returns:
+            Tuple of (width, height) in points
+
+        Raises:
+            ValueError: If PDF cannot be read or has no pages
+        """
+        if self._page_dimensions is None:
+            self.prepare_template()
+        assert self._page_dimensions is not None
+        return self._page_dimensions
+
+    def _read_page_dimensions(self) -> tuple[float, float]:
+        """Parse the dimensions of the first page from the cached reader.
+
         Returns:
             Tuple of (width, height) in points
 
@@ -136,7 +310,8 @@ class PDFProcessor:
             ValueError: If PDF cannot be read or has no pages
         """
         try:
-            reader = PdfReader(str(self.worksheet_path))
+            assert self._reader is not None
+            reader = self._reader
 
             if len(reader.pages) == 0:
                 raise ValueError("PDF has no pages")
@@ -166,6 +341,9 @@ class PDFProcessor:
             If PDF is 595x842 points and A4 is 21x29.7 cm:
             DPI = 595 / (21 / 2.54) = 72 (standard PDF DPI)
         """
+        if self._effective_dpi is not None:
+            return self._effective_dpi
+
         page_width, page_height = self._get_page_dimensions()
 
         # Convert A4 dimensions from cm to inches
@@ -180,148 +358,277 @@ class PDFProcessor:
             f"(page width: {page_width} points, A4 width: {a4_width_inches:.2f} inches)"
         )
 
+        self._effective_dpi = effective_dpi
         return effective_dpi
 
-    def _create_overlay(self, student: Student) -> io.BytesIO:
-        """Create a PDF overlay with student photo and optional name.
+    @functools.cached_property
+    def _overlay_geometry(self) -> dict[str, float]:
+        """Overlay geometry that only depends on the worksheet and settings.
 
-        Args:
-            student: Student object with name and photo path
+        Computed once per processor and shared by all students' overlays.
 
         Returns:
-            BytesIO buffer containing the overlay PDF
+            Dictionary of page size, font size, margins and gaps in points
 
         Raises:
-            ValueError: If photo cannot be processed
+            ValueError: If PDF cannot be read or has no pages
         """
-        # Get page dimensions
         page_width, page_height = self._get_page_dimensions()
 
-        # Calculate effective DPI for A4 print size
-        effective_dpi = self._calculate_a4_dpi()
+        return {
+            "page_width": page_width,
+            "page_height": page_height,
+            # Dynamic font size if not set (2.25% of PDF height)
+            "font_size": self.font_size if self.font_size is not None else page_height * 0.0225,
+            # Margins using user-defined percentages
+            "margin_right": page_width * (self.photo_right_margin_percent / 100),
+            "margin_top": page_height * (self.photo_top_margin_percent / 100),
+            "name_top_margin": page_height * (self.name_top_margin_percent / 100),
+            # Dynamic gap between name and photo (1.3% of width)
+            "text_photo_gap": page_width * 0.013,
+            # Minimum left margin for the name (3.5% like margin_right)
+            "min_x": page_width * 0.035,
+            # 1 cm = 28.35 points (PDF standard)
+            "photo_size_points": self.photo_size_cm * 28.35,
+        }
 
-        # Calculate dynamic font size if not set (2.25% of PDF height)
-        font_size = self.font_size if self.font_size is not None else page_height * 0.0225
+    @functools.cached_property
+    def _draw_name(self) -> Callable[[canvas.Canvas, str, float, float], None]:
+        """Name drawing function for the name_position setting.
 
-        # Calculate margins using user-defined percentages
-        margin_right = page_width * (self.photo_right_margin_percent / 100)
-        margin_top = page_height * (self.photo_top_margin_percent / 100)
+        Raises:
+            ValueError: If name_position is unknown
+        """
+        placements: dict[str, Callable[[canvas.Canvas, str, float, float], None]] = {
+            "beside_photo": self._draw_name_beside_photo,
+            "center": self._draw_name_center,
+            "left": self._draw_name_left,
+            "right": self._draw_name_right,
+        }
+        try:
+            return placements[self.name_position]
+        except KeyError:
+            raise ValueError(f"Unknown name position: {self.name_position}") from None
+
+    def _draw_name_beside_photo(
+        self, c: canvas.Canvas, name: str, photo_x: float, photo_y: float
+    ) -> None:
+        """Draw "Name: ..." to the left of the photo."""
+        geometry = self._overlay_geometry
+        font_size = geometry["font_size"]
+
+        # Position name to the left of the photo with dynamic formatting
+        text = f"Name: {name}"
+        text_width = c.stringWidth(text, self.font_name, font_size)
+
+        # Calculate horizontal position, ensuring it doesn't go off the left edge
+        name_x = photo_x - text_width - geometry["text_photo_gap"]
+        # Ensure minimum margin on the left (3.5% like margin_right)
+        name_x = max(name_x, geometry["min_x"])
+
+        # Vertical position: percentage-based distance from top edge
+        name_top_margin_pt = geometry["name_top_margin"]
+        name_y = geometry["page_height"] - name_top_margin_pt
 
-        # Create a buffer for the overlay PDF
-        buffer = io.BytesIO()
+        logger.debug(
+            f"Name text: '{text}' | Font: {self.font_name} | Size: {font_size:.1f}pt | "
+            f"Position: ({name_x:.1f}, {name_y:.1f}) | Text width: {text_width:.1f}pt | "
+            f"Page width: {geometry['page_width']:.1f}pt | Top margin: {self.name_top_margin_percent}% ({name_top_margin_pt:.1f}pt)"
+        )
 
-        # Create canvas for drawing
-        c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
-        c.setPageCompression(0)  # Disable compression for maximum image quality
+        c.drawString(name_x, name_y, text)
+
+    def _draw_name_center(
+        self, c: canvas.Canvas, name: str, photo_x: float, photo_y: float
+    ) -> None:
+        """Draw the name centered at the top of the page."""
+        geometry = self._overlay_geometry
+        name_x = geometry["page_width"] / 2
+        name_y = geometry["page_height"] - geometry["margin_top"] - (geometry["font_size"] / 2)
+        c.drawCentredString(name_x, name_y, name)
+
+    def _draw_name_left(
+        self, c: canvas.Canvas, name: str, photo_x: float, photo_y: float
+    ) -> None:
+        """Draw the name at the top left of the page."""
+        geometry = self._overlay_geometry
+        name_x = geometry["margin_right"]
+        name_y = geometry["page_height"] - geometry["margin_top"] - (geometry["font_size"] / 2)
+        c.drawString(name_x, name_y, name)
+
+    def _draw_name_right(
+        self, c: canvas.Canvas, name: str, photo_x: float, photo_y: float
+    ) -> None:
+        """Draw the name right-aligned below the photo."""
+        geometry = self._overlay_geometry
+        name_x = geometry["page_width"] - geometry["margin_right"]
+        name_y = photo_y - geometry["font_size"] - geometry["text_photo_gap"]
+        c.drawRightString(name_x, name_y, name)
 
-        try:
-            # Load and process student photo
-            photo = Image.open(student.photo_path)
-            photo = ensure_rgb(photo)  # Convert to RGB if needed
+    def _create_overlay(self, student: Student) -> io.BytesIO:
+        """Create a PDF overlay with student photo and optional name.
 
-            # Keep original resolution - don't scale the pixels!
-            # We only scale the display size in the PDF
-            original_width, original_height = photo.size
+        Args:
+            student: Student object with name and photo path
 
-            # Convert photo to ReportLab ImageReader with maximum quality
-            photo_buffer = io.BytesIO()
-            photo.save(photo_buffer, format="PNG", optimize=False)  # PNG = lossless, no quality loss
-            photo_buffer.seek(0)
-            photo_reader = ImageReader(photo_buffer)
+        Returns:
+            BytesIO buffer containing the overlay PDF
 
-            # Calculate display size in PDF (in points, not pixels!)
-            # 1 cm = 28.35 points (PDF standard)
-            photo_size_points = self.photo_size_cm * 28.35
+        Raises:
+            ValueError: If photo cannot be processed
+        """
+        # Page geometry is the same for every student
+        geometry = self._overlay_geometry
+        page_width = geometry["page_width"]
+        page_height = geometry["page_height"]
+        font_size = geometry["font_size"]
+        margin_right = geometry["margin_right"]
+        margin_top = geometry["margin_top"]
 
-            # Maintain aspect ratio for display size
-            aspect_ratio = original_width / original_height
-            if original_width >= original_height:
-                photo_width = photo_size_points
-                photo_height = photo_size_points / aspect_ratio
-            else:
-                photo_height = photo_size_points
-                photo_width = photo_size_points * aspect_ratio
-
-            x_position = page_width - photo_width - margin_right
-            y_position = page_height - photo_height - margin_top
-
-            # Draw photo
-            c.drawImage(
-                photo_reader,
-                x_position,
-                y_position,
-                width=photo_width,
-                height=photo_height,
-                preserveAspectRatio=True,
-            )
+        try:
+            # Without a name the overlay only depends on the photo and the
+            # page, so it is cached across worksheets
+            if not self.add_name:
+                return io.BytesIO(
+                    _build_photo_only_overlay(
+                        page_width,
+                        page_height,
+                        margin_right,
+                        margin_top,
+                        geometry["photo_size_points"],
+                        str(student.photo_path),
+                        student.photo_path.stat().st_mtime,
+                    )
+                )
 
-            logger.debug(
-                f"Added photo at position ({x_position:.1f}, {y_position:.1f}), "
-                f"size {photo_width}x{photo_height} points"
+            # Create a buffer and canvas for the overlay PDF
+            buffer = io.BytesIO()
+            c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
+            c.setPageCompression(0)  # Disable compression for maximum image quality
+
+            # Draw the photo at full resolution
+            photo = load_student_photo(student.photo_path)
+            x_position, y_position = _draw_photo(
+                c,
+                photo,
+                page_width,
+                page_height,
+                margin_right,
+                margin_top,
+                geometry["photo_size_points"],
             )
 
-            # Add student name if requested
-            if self.add_name:
-                c.setFont(self.font_name, font_size)
+            # Add student name
+            c.setFont(self.font_name, font_size)
+            self._draw_name(c, student.name, x_position, y_position)
 
-                # Calculate dynamic gap between name and photo (1.3% of width)
-                text_photo_gap = page_width * 0.013
+            logger.debug(
+                f"Added name '{student.name}' at position {self.name_position}"
+            )
 
-                if self.name_position == "beside_photo":
-                    # Position name to the left of the photo with dynamic formatting
-                    text = f"Name: {student.name}"
-                    text_width = c.stringWidth(text, self.font_name, font_size)
+            # Finalize the canvas
+            c.save()
 
-                    # Calculate horizontal position, ensuring it doesn't go off the left edge
-                    name_x = x_position - text_width - text_photo_gap
-                    # Ensure minimum margin on the left (3.5% like margin_right)
-                    min_x = page_width * 0.035
-                    name_x = max(name_x, min_x)
+            # Reset buffer position
+            buffer.seek(0)
 
-                    # Calculate vertical position: percentage-based distance from top edge
-                    name_top_margin_pt = page_height * (self.name_top_margin_percent / 100)
-                    name_y = page_height - name_top_margin_pt
+            return buffer
 
-                    logger.debug(
-                        f"Name text: '{text}' | Font: {self.font_name} | Size: {font_size:.1f}pt | "
-                        f"Position: ({name_x:.1f}, {name_y:.1f}) | Text width: {text_width:.1f}pt | "
-                        f"Page width: {page_width:.1f}pt | Top margin: {self.name_top_margin_percent}% ({name_top_margin_pt:.1f}pt)"
-                    )
+        except Exception as e:
+            raise ValueError(f"Error creating overlay for {student.name}: {e}") from e
 
-                    c.drawString(name_x, name_y, text)
+    @staticmethod
+    def _add_stream(writer: PdfWriter, data: bytes) -> IndirectObject:
+        """Add an uncompressed content stream to the writer.
 
-                elif self.name_position == "center":
-                    # Center of the page
-                    name_x = page_width / 2
-                    name_y = page_height - margin_top - (font_size / 2)
-                    c.drawCentredString(name_x, name_y, student.name)
+        Args:
+            writer: Writer of the personalized PDF
+            data: Content stream operators
 
-                elif self.name_position == "left":
-                    # Left side of the page
-                    name_x = margin_right
-                    name_y = page_height - margin_top - (font_size / 2)
-                    c.drawString(name_x, name_y, student.name)
+        Returns:
+            Reference to the new stream
+        """
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        return writer._add_object(stream)
 
-                elif self.name_position == "right":
-                    # Right side of the page (above photo)
-                    name_x = page_width - margin_right
-                    name_y = y_position - font_size - text_photo_gap
-                    c.drawRightString(name_x, name_y, student.name)
+    def _create_overlay_form(self, writer: PdfWriter, overlay_page: PageObject) -> IndirectObject:
+        """Turn the overlay page into a form XObject of the writer.
 
-                logger.debug(
-                    f"Added name '{student.name}' at position {self.name_position}"
-                )
+        Args:
+            writer: Writer of the personalized PDF
+            overlay_page: Page created by _create_overlay
 
-            # Finalize the canvas
-            c.save()
+        Returns:
+            Reference to the form XObject
+        """
+        contents = overlay_page.get_contents()
+        assert contents is not None
+        resources = cast(DictionaryObject, overlay_page["/Resources"].get_object())
+
+        form = DecodedStreamObject()
+        form.set_data(contents.get_data())
+        form.update({
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject(overlay_page.mediabox),
+            NameObject("/Resources"): resources.clone(writer),
+        })
+        return writer._add_object(form)
+
+    def _stamp_overlay(
+        self,
+        writer: PdfWriter,
+        writer_page: PageObject,
+        overlay_form: IndirectObject,
+        save_state: IndirectObject,
+    ) -> None:
+        """Draw the overlay form on top of a page.
+
+        The page's own content streams are kept as they are and wrapped in
+        a saved graphics state, followed by a stream drawing the overlay.
+        Nothing has to be parsed, unlike PageObject.merge_page.
 
-            # Reset buffer position
-            buffer.seek(0)
+        Args:
+            writer: Writer of the personalized PDF
+            writer_page: Writer's copy of the worksheet page
+            overlay_form: Form XObject from _create_overlay_form
+            save_state: Shared stream saving the graphics state ("q")
+        """
+        resources = writer_page.get("/Resources")
+        if resources is None:
+            resources = DictionaryObject()
+            writer_page[NameObject("/Resources")] = resources
+        else:
+            resources = resources.get_object()
 
-            return buffer
+        xobjects = resources.get("/XObject")
+        if xobjects is None:
+            xobjects = DictionaryObject()
+            resources[NameObject("/XObject")] = xobjects
+        else:
+            xobjects = xobjects.get_object()
+
+        # Pages may share their resources, so the name can already be ours
+        name = NameObject("/WsOverlay")
+        suffix = 0
+        while name in xobjects and xobjects.raw_get(name) != overlay_form:
+            suffix += 1
+            name = NameObject(f"/WsOverlay{suffix}")
+        xobjects[name] = overlay_form
+
+        page_contents: list[Any] = []
+        if "/Contents" in writer_page:
+            contents = writer_page["/Contents"].get_object()
+            if isinstance(contents, ArrayObject):
+                page_contents = list(contents)
+            else:
+                page_contents = [writer_page.raw_get("/Contents")]
 
-        except Exception as e:
-            raise ValueError(f"Error creating overlay for {student.name}: {e}") from e
+        draw_overlay = self._add_stream(writer, f"\nQ\nq {name} Do Q\n".encode())
+        writer_page[NameObject("/Contents")] = ArrayObject(
+            [save_state, *page_contents, draw_overlay]
+        )
 
     def personalize_for_student(self, student: Student, output_path: Path) -> None:
         """Create a personalized worksheet for a specific student.
@@ -337,8 +644,8 @@ class PDFProcessor:
         logger.info(f"Personalizing worksheet for: {student.name}")
 
         try:
-            # Read original PDF
-            reader = PdfReader(str(self.worksheet_path))
+            # Read original PDF from the cached bytes
+            reader = self._open_worksheet()
             writer = PdfWriter()
 
             # Create overlay
@@ -346,17 +653,23 @@ class PDFProcessor:
             overlay_reader = PdfReader(overlay_buffer)
             overlay_page = overlay_reader.pages[0]
 
-            # Merge overlay with each page of the original PDF
+            # The overlay becomes one form XObject that every page draws,
+            # instead of merging (and re-parsing) it into each page
+            overlay_form = self._create_overlay_form(writer, overlay_page)
+            save_state = self._add_stream(writer, b"q\n")
+
+            # Stamp the writer's copy of each page so the shared reader
+            # stays untouched for the next student
             for page_num, page in enumerate(reader.pages):
-                # Merge overlay with the page
-                page.merge_page(overlay_page)
-                writer.add_page(page)
+                writer_page = writer.add_page(page)
+                self._stamp_overlay(writer, writer_page, overlay_form, save_state)
 
                 logger.debug(f"Processed page {page_num + 1}/{len(reader.pages)}")
 
             # Write output PDF
-            with open(output_path, "wb") as output_file:
-                writer.write(output_file)
+            with atomic_output(output_path) as tmp_path:
+                with open(tmp_path, "wb") as output_file:
+                    writer.write(output_file)
 
             logger.info(f"Created personalized PDF: {output_path}")
 
@@ -364,3 +677,31 @@ class PDFProcessor:
             raise ValueError(
                 f"Error personalizing worksheet for {student.name}: {e}"
             ) from e
+
+    def personalize_batch(
+        self,
+        students: Sequence[Student],
+        output_paths: Sequence[Path],
+        max_workers: Optional[int] = None,
+    ) -> list[tuple[Student, Exception]]:
+        """Create personalized worksheets for many students in parallel.
+
+        Each worker process builds its own processor for this worksheet
+        (reading the current settings), so only paths and students are sent
+        to the workers.
+
+        Args:
+            students: Students to personalize for
+            output_paths: Output path for each student (same order as students)
+            max_workers: Number of worker processes (default: min(students, CPUs))
+
+        Returns:
+            List of (student, error) for every student that failed
+
+        Raises:
+            ValueError: If students and output_paths differ in length
+        """
+        return personalize_batch(
+            type(self), self.worksheet_path, self.add_name,
+            students, output_paths, max_workers,
+        )
@@ -4,9 +4,11 @@ This module provides the main WorksheetPersonalizer class that orchestrates
 the entire personalization process, handling both PDF and image formats.
 """
 
+import hashlib
 import logging
+import shutil
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from worksheet_personalizer.core.image_processor import ImageProcessor
 from worksheet_personalizer.core.pdf_processor import PDFProcessor
@@ -19,6 +21,14 @@ from worksheet_personalizer.utils.file_handler import (
 
 logger = logging.getLogger(__name__)
 
+# Processor class per worksheet extension
+_PROCESSOR_MAP: dict[str, type[Union[PDFProcessor, ImageProcessor]]] = {
+    ".pdf": PDFProcessor,
+    ".png": ImageProcessor,
+    ".jpg": ImageProcessor,
+    ".jpeg": ImageProcessor,
+}
+
 
 class WorksheetPersonalizer:
     """Orchestrates the worksheet personalization process.
@@ -52,12 +62,13 @@ class WorksheetPersonalizer:
             add_name: Whether to add student names to worksheets
 
         Raises:
-            FileNotFoundError: If worksheet or students folder doesn't exist
-            ValueError: If worksheet format is not supported
+            FileNotFoundError: If students folder doesn't exist. A missing
+                worksheet is only reported on first use, by
+                prepare_template() or process_all().
+            ValueError: If worksheet extension is not supported
         """
-        if not worksheet_path.exists():
-            raise FileNotFoundError(f"Worksheet file not found: {worksheet_path}")
-
+        # A missing worksheet is reported by the processor, which checks it
+        # anyway
         if not students_folder.exists():
             raise FileNotFoundError(f"Students folder not found: {students_folder}")
 
@@ -66,8 +77,7 @@ class WorksheetPersonalizer:
         self.output_folder = output_folder
         self.add_name = add_name
 
-        # Detect format and create appropriate processor
-        self.format = self._detect_format()
+        # Create the processor for the worksheet format
         self.processor = self._get_processor()
 
         logger.info(
@@ -75,52 +85,44 @@ class WorksheetPersonalizer:
             f"format={self.format}, add_name={add_name}"
         )
 
-    def _detect_format(self) -> str:
-        """Detect the worksheet format based on file extension.
+    @property
+    def format(self) -> str:
+        """Worksheet format handled by the processor: "pdf" or "image"."""
+        return "pdf" if isinstance(self.processor, PDFProcessor) else "image"
+
+    def _get_processor(self) -> Union[PDFProcessor, ImageProcessor]:
+        """Get the appropriate processor for the worksheet file extension.
 
         Returns:
-            Format string: "pdf" or "image"
+            PDFProcessor or ImageProcessor instance
 
         Raises:
             ValueError: If format is not supported
         """
         extension = self.worksheet_path.suffix.lower()
+        processor_class = _PROCESSOR_MAP.get(extension)
 
-        if extension == ".pdf":
-            return "pdf"
-        elif extension in {".png", ".jpg", ".jpeg"}:
-            return "image"
-        else:
+        if processor_class is None:
             raise ValueError(
                 f"Unsupported worksheet format: {extension}. "
                 f"Supported formats: .pdf, .png, .jpg, .jpeg"
             )
 
-    def _get_processor(self) -> Union[PDFProcessor, ImageProcessor]:
-        """Get the appropriate processor based on detected format.
-
-        Returns:
-            PDFProcessor or ImageProcessor instance
-
-        Raises:
-            ValueError: If format is invalid
-        """
-        if self.format == "pdf":
-            return PDFProcessor(self.worksheet_path, self.add_name)
-        elif self.format == "image":
-            return ImageProcessor(self.worksheet_path, self.add_name)
-        else:
-            raise ValueError(f"Invalid format: {self.format}")
+        return processor_class(self.worksheet_path, self.add_name)
 
-    def process_all(self) -> list[Path]:
+    def process_all(self, max_workers: Optional[int] = None) -> list[Path]:
         """Process worksheets for all students in the folder.
 
         This method:
         1. Discovers all student photos in the students folder
         2. Ensures the output directory exists
-        3. Creates a personalized worksheet for each student
+        3. Creates a personalized worksheet for each student, in parallel
+           worker processes
         4. Returns the list of created files
 
+        Args:
+            max_workers: Number of worker processes (default: min(students, CPUs))
+
         Returns:
             List of paths to created personalized worksheets
 
@@ -132,51 +134,128 @@ class WorksheetPersonalizer:
 
         # Discover students
         students = discover_student_photos(self.students_folder)
-        logger.info(f"Found {len(students)} student(s) to process")
 
         # Ensure output directory exists
         ensure_output_dir(self.output_folder)
 
-        # Process each student
-        created_files: list[Path] = []
-        errors: list[tuple[Student, Exception]] = []
-
-        for i, student in enumerate(students, 1):
+        student_count = len(students)
+        logger.info("Found %d student(s) to process", student_count)
+
+        # Generate output filenames
+        worksheet_path = self.worksheet_path
+        output_folder = self.output_folder
+        output_paths = [
+            generate_output_filename(worksheet_path, student.name, output_folder)
+            for student in students
+        ]
+
+        # Without names, students sharing a byte-identical photo get the
+        # same worksheet, so it is only personalized once and copied
+        copies = {} if self.add_name else self._find_duplicate_photos(students)
+        pending = [i for i in range(student_count) if i not in copies]
+        pending_students = [students[i] for i in pending]
+        pending_paths = [output_paths[i] for i in pending]
+
+        # Personalize in worker processes; a single student is not worth
+        # starting a pool for
+        errors: list[tuple[Student, Exception]]
+        if len(pending) > 1:
+            errors = self.processor.personalize_batch(
+                pending_students, pending_paths, max_workers
+            )
+        else:
+            errors = []
+            for student, output_path in zip(pending_students, pending_paths):
+                try:
+                    self.processor.personalize_for_student(student, output_path)
+                except Exception as e:
+                    errors.append((student, e))
+
+        error_by_student = {id(student): error for student, error in errors}
+        for copy_index, source_index in copies.items():
+            student = students[copy_index]
+            source_error = error_by_student.get(id(students[source_index]))
+            if source_error is not None:
+                errors.append((student, source_error))
+                continue
             try:
-                logger.info(f"Processing {i}/{len(students)}: {student.name}")
-
-                # Generate output filename
-                output_path = generate_output_filename(
-                    self.worksheet_path, student.name, self.output_folder
+                shutil.copyfile(output_paths[source_index], output_paths[copy_index])
+                logger.debug(
+                    "Copied worksheet of %s for %s",
+                    students[source_index].name,
+                    student.name,
                 )
-
-                # Personalize worksheet
-                self.processor.personalize_for_student(student, output_path)
-
-                created_files.append(output_path)
-                logger.info(f"✓ Successfully created: {output_path.name}")
-
-            except Exception as e:
-                logger.error(f"✗ Error processing {student.name}: {e}")
+            except OSError as e:
                 errors.append((student, e))
+
+        failed = {id(student) for student, _ in errors}
+        created_files: list[Path] = []
+        append = created_files.append
+        for student, output_path in zip(students, output_paths):
+            if id(student) in failed:
                 continue
+            append(output_path)
+            logger.info("✓ Successfully created: %s", output_path.name)
+
+        for student, error in errors:
+            logger.error("✗ Error processing %s: %s", student.name, error)
 
         # Summary
         logger.info(
-            f"\nPersonalization complete: {len(created_files)} successful, "
-            f"{len(errors)} failed"
+            "\nPersonalization complete: %d successful, %d failed",
+            len(created_files),
+            len(errors),
         )
 
         if errors:
             logger.warning("\nFailed students:")
             for student, error in errors:
-                logger.warning(f"  - {student.name}: {error}")
+                logger.warning("  - %s: %s", student.name, error)
 
         if not created_files:
             raise ValueError("No worksheets were successfully created")
 
         return created_files
 
+    @staticmethod
+    def _find_duplicate_photos(students: list[Student]) -> dict[int, int]:
+        """Find students whose photo file is identical to an earlier one.
+
+        Only photos with the same file size are read and hashed, so
+        folders without duplicates cost one stat per photo.
+
+        Args:
+            students: Students to check
+
+        Returns:
+            Mapping of student index to the index of the first student
+            with the same photo content
+        """
+        by_size: dict[int, list[int]] = {}
+        for index, student in enumerate(students):
+            try:
+                size = student.photo_path.stat().st_size
+            except OSError:
+                continue
+            by_size.setdefault(size, []).append(index)
+
+        duplicates: dict[int, int] = {}
+        for indices in by_size.values():
+            if len(indices) < 2:
+                continue
+            first_by_digest: dict[bytes, int] = {}
+            for index in indices:
+                try:
+                    photo_bytes = students[index].photo_path.read_bytes()
+                except OSError:
+                    continue
+                digest = hashlib.blake2b(photo_bytes).digest()
+                first = first_by_digest.setdefault(digest, index)
+                if first != index:
+                    duplicates[index] = first
+
+        return duplicates
+
     def process_single(self, student: Student) -> Path:
         """Process worksheet for a single student.
 
@@ -189,7 +268,7 @@ class WorksheetPersonalizer:
         Raises:
             ValueError: If processing fails
         """
-        logger.info(f"Processing single student: {student.name}")
+        logger.info("Processing single student: %s", student.name)
 
         # Ensure output directory exists
         ensure_output_dir(self.output_folder)
@@ -202,5 +281,5 @@ class WorksheetPersonalizer:
         # Personalize worksheet
         self.processor.personalize_for_student(student, output_path)
 
-        logger.info(f"Created: {output_path}")
+        logger.info("Created: %s", output_path)
         return output_path
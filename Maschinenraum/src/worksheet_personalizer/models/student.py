@@ -76,6 +76,23 @@ class Student(BaseModel):
         name = photo_path.stem.replace("_", " ")
         return cls(name=name, photo_path=photo_path)
 
+    @classmethod
+    def from_scanned_file(cls, name: str, photo_path: Path) -> "Student":
+        """Create a Student for a photo found by a directory scan, skipping validation.
+
+        The scan has already checked that the path is a file with an allowed
+        extension, so the exists/is_file/extension checks of the validator
+        (two stat() calls per photo) are skipped.
+
+        Args:
+            name: The student's name
+            photo_path: Path to an existing photo file with an allowed extension
+
+        Returns:
+            A new Student instance
+        """
+        return cls.model_construct(name=name, photo_path=photo_path)
+
     def __str__(self) -> str:
         """Return a human-readable string representation."""
         return f"Student(name='{self.name}', photo='{self.photo_path.name}')"
@@ -4,23 +4,47 @@ This module provides a simple interface for managing user settings
 stored in a JSON file.
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
-from typing import Literal
+from types import TracebackType
+from typing import Literal, Optional
+
+from worksheet_personalizer.utils.file_handler import atomic_output
 
 logger = logging.getLogger(__name__)
 
 # Settings file location
-SETTINGS_FILE = Path(__file__).parent.parent.parent / "settings.json"
+SETTINGS_FILE = Path(__file__).resolve().parents[2] / "settings.json"
 
 # Name position options
 NamePosition = Literal["beside_photo", "center", "left", "right"]
 
+# Menu number of each name position in the interactive settings
+NAME_POSITION_CHOICES: dict[str, NamePosition] = {
+    "1": "beside_photo",
+    "2": "center",
+    "3": "left",
+    "4": "right",
+}
+
+# Static name position menu, printed as one block
+NAME_POSITION_MENU = (
+    "\n[bold]Name-Position:[/bold]\n"
+    "  1) neben dem Foto (rechts)\n"
+    "  2) mittig auf dem Arbeitsblatt\n"
+    "  3) links auf dem Arbeitsblatt\n"
+    "  4) rechts auf dem Arbeitsblatt"
+)
+
 
 class SettingsManager:
     """Manages user settings for worksheet personalization.
 
+    Changes are written to the settings file right away. Inside a
+    ``with manager:`` block they are collected and written once on exit.
+
     Attributes:
         photo_size_cm: Photo size (long side) in centimeters
         add_name: Whether to add student names
@@ -32,27 +56,70 @@ class SettingsManager:
     def __init__(self) -> None:
         """Initialize settings manager and load settings."""
         self.settings_file = SETTINGS_FILE
+
+        # Whether the settings folder is known to exist (checked on first save)
+        self._settings_dir_ready = False
+
         self.settings = self._load_settings()
 
+        # Unsaved changes, and how many ``with`` blocks defer saving them
+        self._dirty = False
+        self._batch_depth = 0
+
+    def __enter__(self) -> "SettingsManager":
+        """Defer saving changes until the outermost block exits.
+
+        Returns:
+            This settings manager
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Save the changes made inside the block (also on error)."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save the settings if they changed since the last save."""
+        if self._dirty:
+            self._save_settings(self.settings)
+            self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        """Record a change and save it unless saving is deferred."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
     def _load_settings(self) -> dict:
         """Load settings from JSON file.
 
         Returns:
             Dictionary with settings
         """
-        if not self.settings_file.exists():
+        # Open directly instead of probing with exists(): one syscall less
+        # when the file is there, which is the common case
+        try:
+            with open(self.settings_file, "rb") as f:
+                settings = json.loads(f.read())
+        except FileNotFoundError:
             logger.info("Settings file not found, creating default settings")
             return self._create_default_settings()
-
-        try:
-            with open(self.settings_file, "r", encoding="utf-8") as f:
-                settings = json.load(f)
-            logger.debug(f"Loaded settings from {self.settings_file}")
-            return settings
-        except Exception as e:
+        except (OSError, ValueError) as e:
             logger.error(f"Error loading settings: {e}")
             return self._create_default_settings()
 
+        self._settings_dir_ready = True
+        logger.debug(f"Loaded settings from {self.settings_file}")
+        return settings
+
     def _create_default_settings(self) -> dict:
         """Create and save default settings.
 
@@ -77,9 +144,14 @@ class SettingsManager:
             settings: Dictionary with settings to save
         """
         try:
-            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.settings_file, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            # Serialize in one call and write the bytes at once; json.dump
+            # would issue one small write per chunk
+            data = json.dumps(settings, indent=2, ensure_ascii=False).encode("utf-8")
+            if not self._settings_dir_ready:
+                self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+                self._settings_dir_ready = True
+            with atomic_output(self.settings_file) as tmp_path:
+                tmp_path.write_bytes(data)
             logger.info(f"Settings saved to {self.settings_file}")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
@@ -99,12 +171,17 @@ class SettingsManager:
     def set(self, key: str, value) -> None:
         """Set a setting value.
 
+        The settings file is only written if the value changed.
+
         Args:
             key: Setting key
             value: Setting value
         """
+        if key in self.settings and self.settings[key] == value:
+            return
+
         self.settings[key] = value
-        self._save_settings(self.settings)
+        self._mark_dirty()
 
     def get_all(self) -> dict:
         """Get all settings.
@@ -117,11 +194,35 @@ class SettingsManager:
     def update(self, new_settings: dict) -> None:
         """Update multiple settings at once.
 
+        The settings file is written once, and only if a value changed.
+
         Args:
             new_settings: Dictionary with settings to update
         """
-        self.settings.update(new_settings)
-        self._save_settings(self.settings)
+        changed = {
+            key: value
+            for key, value in new_settings.items()
+            if key not in self.settings or self.settings[key] != value
+        }
+        if not changed:
+            return
+
+        self.settings.update(changed)
+        self._mark_dirty()
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings_manager() -> SettingsManager:
+    """Get the process-wide settings manager.
+
+    The settings file is read once per process and the instance is shared
+    by all processors. Call ``get_settings_manager.cache_clear()`` to force
+    a reload from disk.
+
+    Returns:
+        Shared SettingsManager instance
+    """
+    return SettingsManager()
 
 
 def interactive_settings_update() -> None:
@@ -129,20 +230,24 @@ def interactive_settings_update() -> None:
     from rich.console import Console
     from rich.prompt import Prompt, Confirm
 
-    console = Console()
-    manager = SettingsManager()
+    # The settings are printed with explicit markup, so rich's automatic
+    # highlighter (a regex scan of every printed string) is not needed
+    console = Console(highlight=False)
+    manager = get_settings_manager()
 
     console.print("\n[bold cyan]⚙️  Einstellungen für Arbeitsblatt-Personalisierung[/bold cyan]\n")
 
     current_settings = manager.get_all()
 
-    # Display current settings
-    console.print("[bold]Aktuelle Einstellungen:[/bold]")
-    console.print(f"  📏 Fotogröße: [green]{current_settings['photo_size_cm']} cm[/green]")
-    console.print(f"  ✏️  Name hinzufügen: [green]{'Ja' if current_settings['add_name'] else 'Nein'}[/green]")
-    console.print(f"  📍 Name-Position: [green]{current_settings['name_position']}[/green]")
-    console.print(f"  🔤 Schriftgröße: [green]{current_settings['font_size']}[/green]")
-    console.print(f"  📐 Foto-Abstand: [green]{current_settings['photo_margin_cm']} cm[/green]\n")
+    # Display current settings in one render pass instead of one per line
+    console.print(
+        "[bold]Aktuelle Einstellungen:[/bold]\n"
+        f"  📏 Fotogröße: [green]{current_settings['photo_size_cm']} cm[/green]\n"
+        f"  ✏️  Name hinzufügen: [green]{'Ja' if current_settings['add_name'] else 'Nein'}[/green]\n"
+        f"  📍 Name-Position: [green]{current_settings['name_position']}[/green]\n"
+        f"  🔤 Schriftgröße: [green]{current_settings['font_size']}[/green]\n"
+        f"  📐 Foto-Abstand: [green]{current_settings['photo_margin_cm']} cm[/green]\n"
+    )
 
     # Ask if user wants to change settings
     if not Confirm.ask("Möchten Sie die Einstellungen ändern?"):
@@ -172,25 +277,15 @@ def interactive_settings_update() -> None:
     # Name position (only if add_name is True)
     name_position = current_settings['name_position']
     if add_name:
-        console.print("\n[bold]Name-Position:[/bold]")
-        console.print("  1) neben dem Foto (rechts)")
-        console.print("  2) mittig auf dem Arbeitsblatt")
-        console.print("  3) links auf dem Arbeitsblatt")
-        console.print("  4) rechts auf dem Arbeitsblatt")
+        console.print(NAME_POSITION_MENU)
 
         position_choice = Prompt.ask(
             "Wählen Sie eine Position",
-            choices=["1", "2", "3", "4"],
+            choices=list(NAME_POSITION_CHOICES),
             default="1"
         )
 
-        position_map = {
-            "1": "beside_photo",
-            "2": "center",
-            "3": "left",
-            "4": "right"
-        }
-        name_position = position_map[position_choice]
+        name_position = NAME_POSITION_CHOICES[position_choice]
 
     # Font size
     font_size = Prompt.ask(
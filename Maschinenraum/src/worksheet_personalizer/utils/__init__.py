@@ -1,6 +1,7 @@
 """Utility functions and helpers for worksheet personalization."""
 
 from worksheet_personalizer.utils.file_handler import (
+    atomic_output,
     discover_student_photos,
     ensure_output_dir,
     generate_output_filename,
@@ -13,6 +14,7 @@ from worksheet_personalizer.utils.image_utils import (
 )
 
 __all__ = [
+    "atomic_output",
     "discover_student_photos",
     "ensure_output_dir",
     "generate_output_filename",
@@ -5,12 +5,18 @@ output directories.
 """
 
 import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from worksheet_personalizer.models.student import Student
 
 logger = logging.getLogger(__name__)
 
+# Lowercase photo extensions, matched against each scanned file name
+_PHOTO_SUFFIXES = frozenset(ext.lower() for ext in Student.ALLOWED_EXTENSIONS)
+
 
 def discover_student_photos(folder: Path) -> list[Student]:
     """Discover and create Student objects from photos in a folder.
@@ -42,37 +48,31 @@ def discover_student_photos(folder: Path) -> list[Student]:
     if not folder.is_dir():
         raise ValueError(f"Path is not a directory: {folder}")
 
-    # Find all image files
-    image_extensions = Student.ALLOWED_EXTENSIONS
-    photo_files: list[Path] = []
+    # One scandir pass: DirEntry.is_file() reuses the type from the directory
+    # listing, so the photos need no further stat() before they are accepted
+    image_extensions = _PHOTO_SUFFIXES
+    splitext = os.path.splitext
+    students: list[Student] = []
 
-    for ext in image_extensions:
-        # Search for files with each extension (case-insensitive)
-        photo_files.extend(folder.glob(f"*{ext}"))
-        photo_files.extend(folder.glob(f"*{ext.upper()}"))
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            stem, extension = splitext(entry.name)
+            if extension.lower() in image_extensions and entry.is_file():
+                student = Student.from_scanned_file(
+                    stem.replace("_", " "), Path(entry.path)
+                )
+                students.append(student)
+                logger.debug(f"Discovered student: {student.name} ({entry.name})")
 
-    if not photo_files:
+    if not students:
         raise ValueError(
             f"No valid student photos found in {folder}. "
             f"Expected formats: {', '.join(image_extensions)}"
         )
 
-    # Create Student objects
-    students: list[Student] = []
-    for photo_path in photo_files:
-        try:
-            student = Student.from_photo_path(photo_path)
-            students.append(student)
-            logger.debug(f"Discovered student: {student.name} ({photo_path.name})")
-        except ValueError as e:
-            logger.warning(f"Skipping invalid photo {photo_path.name}: {e}")
-            continue
-
-    if not students:
-        raise ValueError(f"No valid student photos could be loaded from {folder}")
-
-    # Sort by name for consistent processing order
-    students.sort(key=lambda s: s.name.lower())
+    # Sort by name for consistent processing order; casefold() also folds
+    # "ß" to "ss", so German names sort as expected
+    students.sort(key=lambda s: s.name.casefold())
 
     logger.info(f"Discovered {len(students)} student(s) in {folder}")
     return students
@@ -93,16 +93,46 @@ def ensure_output_dir(path: Path) -> None:
         >>> Path("./output").exists()
         True
     """
-    if path.exists():
+    # Try mkdir first: an existing path is only stat()ed when mkdir refuses
+    try:
+        path.mkdir(parents=True)
+        logger.info(f"Created output directory: {path}")
+    except FileExistsError:
         if not path.is_dir():
-            raise ValueError(f"Output path exists but is not a directory: {path}")
+            raise ValueError(
+                f"Output path exists but is not a directory: {path}"
+            ) from None
         logger.debug(f"Output directory already exists: {path}")
-    else:
-        try:
-            path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created output directory: {path}")
-        except PermissionError as e:
-            raise PermissionError(f"Cannot create output directory {path}: {e}") from e
+    except PermissionError as e:
+        raise PermissionError(f"Cannot create output directory {path}: {e}") from e
+
+
+@contextmanager
+def atomic_output(path: Path) -> Iterator[Path]:
+    """Write a file through a temporary sibling that replaces it on success.
+
+    The caller writes to the yielded path; once the block finishes it is
+    renamed onto path with a single os.replace(), so a crash never leaves a
+    partially written worksheet behind. On error the temporary file is
+    removed.
+
+    Args:
+        path: Final path of the file
+
+    Yields:
+        Temporary path in the same directory to write to
+
+    Example:
+        >>> with atomic_output(Path("out.pdf")) as tmp_path:
+        ...     tmp_path.write_bytes(b"%PDF-1.4")
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def generate_output_filename(
@@ -130,15 +160,12 @@ def generate_output_filename(
         >>> path.name
         'math_test_max_mustermann.pdf'
     """
-    # Get original filename without extension
-    original_name = worksheet_path.stem
+    # Split the name once instead of parsing it for .stem and .suffix
+    original_name, extension = os.path.splitext(worksheet_path.name)
 
     # Convert student name to filename-safe format (spaces to underscores)
     safe_student_name = student_name.replace(" ", "_").lower()
 
-    # Get file extension
-    extension = worksheet_path.suffix
-
     # Construct output filename
     output_filename = f"{original_name}_{safe_student_name}{extension}"
 
@@ -0,0 +1,187 @@
+"""Tests for batch processor."""
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from worksheet_personalizer import batch_processor
+from worksheet_personalizer.batch_processor import BatchProcessor
+from worksheet_personalizer.core.pdf_processor import PDFProcessor
+
+
+@pytest.fixture
+def batch_base(
+    temp_dir: Path,
+    sample_worksheet_pdf: Path,
+    sample_students_folder: Path,
+) -> Path:
+    """Create a base folder with Input-A, Schüler-A and Ausgabe-A.
+
+    Returns:
+        Path to the base folder
+    """
+    base = temp_dir / "batch"
+    (base / "Input-A").mkdir(parents=True)
+    (base / "Ausgabe-A").mkdir()
+    sample_worksheet_pdf.rename(base / "Input-A" / "worksheet.pdf")
+    sample_students_folder.rename(base / "Schüler-A")
+    return base
+
+
+def test_load_students(batch_base: Path) -> None:
+    """Test loading students from a folder of photos."""
+    processor = BatchProcessor(batch_base)
+
+    students = processor._load_students(batch_base / "Schüler-A")
+
+    names = sorted(student.name for student in students)
+    assert names == ["anna_schmidt", "max_mustermann", "tom_mueller"]
+
+
+def test_load_students_ignores_other_entries(batch_base: Path) -> None:
+    """Test that non-photo files and subfolders are skipped."""
+    students_folder = batch_base / "Schüler-A"
+    (students_folder / "notes.txt").write_text("not a photo")
+    (students_folder / "subfolder.jpg").mkdir()
+    Image.new("RGB", (10, 10)).save(students_folder / "UPPER.JPG")
+
+    processor = BatchProcessor(batch_base)
+    students = processor._load_students(students_folder)
+
+    names = {student.name for student in students}
+    assert "UPPER" in names
+    assert "notes" not in names
+    assert "subfolder" not in names
+    assert len(students) == 4
+
+
+def test_load_students_missing_folder(temp_dir: Path) -> None:
+    """Test that a missing students folder yields no students."""
+    processor = BatchProcessor(temp_dir)
+
+    assert processor._load_students(temp_dir / "missing") == []
+
+
+def test_process_group(batch_base: Path) -> None:
+    """Test processing a group creates one worksheet per student."""
+    processor = BatchProcessor(batch_base)
+
+    processor.process_group("A")
+
+    output_folder = batch_base / "Ausgabe-A" / "worksheet"
+    created = sorted(path.name for path in output_folder.iterdir())
+    assert created == ["anna_schmidt.pdf", "max_mustermann.pdf", "tom_mueller.pdf"]
+    # Original worksheet stays in the Input folder
+    assert (batch_base / "Input-A" / "worksheet.pdf").exists()
+
+
+def test_process_group_continues_after_failed_student(batch_base: Path) -> None:
+    """Test that one broken photo does not stop the other students."""
+    (batch_base / "Schüler-A" / "broken.jpg").write_bytes(b"not an image")
+    processor = BatchProcessor(batch_base)
+
+    processor.process_group("A")
+
+    output_folder = batch_base / "Ausgabe-A" / "worksheet"
+    created = {path.name for path in output_folder.iterdir()}
+    assert "broken.pdf" not in created
+    assert len(created) == 3
+
+
+def test_create_output_folder_numbers_duplicates(temp_dir: Path) -> None:
+    """Test that existing worksheet folders get a numbered sibling."""
+    output_base = temp_dir / "Ausgabe-A"
+    (output_base / "worksheet").mkdir(parents=True)
+    (output_base / "worksheet_2").mkdir()
+    processor = BatchProcessor(temp_dir)
+
+    output_folder = processor._create_output_folder(output_base, "worksheet")
+
+    assert output_folder == output_base / "worksheet_3"
+    assert output_folder.is_dir()
+
+
+def test_create_output_folder_missing_base(temp_dir: Path) -> None:
+    """Test that a missing output base folder is created."""
+    output_base = temp_dir / "Ausgabe-B"
+    processor = BatchProcessor(temp_dir)
+
+    output_folder = processor._create_output_folder(output_base, "worksheet")
+
+    assert output_folder == output_base / "worksheet"
+    assert output_folder.is_dir()
+
+
+def test_process_all_groups(batch_base: Path, sample_worksheet_image: Path) -> None:
+    """Test that all groups are processed and missing ones are skipped."""
+    (batch_base / "Input-B").mkdir()
+    (batch_base / "Schüler-B").mkdir()
+    sample_worksheet_image.rename(batch_base / "Input-B" / "sheet.png")
+    Image.new("RGB", (30, 40), color="red").save(batch_base / "Schüler-B" / "lea.jpg")
+    processor = BatchProcessor(batch_base)
+
+    processor.process_all_groups()
+
+    assert len(list((batch_base / "Ausgabe-A" / "worksheet").iterdir())) == 3
+    assert (batch_base / "Ausgabe-B" / "sheet" / "lea.png").exists()
+    assert not (batch_base / "Ausgabe-C").exists()
+
+
+def test_move_processed_worksheet(batch_base: Path) -> None:
+    """Test moving a processed worksheet into its output folder."""
+    worksheet_path = batch_base / "Input-A" / "worksheet.pdf"
+    output_folder = batch_base / "Ausgabe-A" / "worksheet"
+    output_folder.mkdir()
+    processor = BatchProcessor(batch_base)
+
+    processor._move_processed_worksheet(worksheet_path, output_folder)
+
+    assert not worksheet_path.exists()
+    assert (output_folder / "worksheet.pdf").exists()
+
+
+def test_iter_worksheets_filters_formats(batch_base: Path) -> None:
+    """Test that only supported worksheet files are yielded."""
+    input_folder = batch_base / "Input-A"
+    (input_folder / "readme.txt").write_text("ignore me")
+    (input_folder / "folder.pdf").mkdir()
+    processor = BatchProcessor(batch_base)
+
+    worksheets = list(processor._iter_worksheets(input_folder))
+
+    assert worksheets == [(input_folder / "worksheet.pdf", PDFProcessor)]
+
+
+class _BrokenPool:
+    """Stand-in for a process pool whose worker has crashed."""
+
+    def submit(self, *args: object, **kwargs: object) -> None:
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def test_process_group_recovers_from_broken_pool(
+    batch_base: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a broken shared pool is replaced and its students retried."""
+    monkeypatch.setattr(
+        batch_processor, "create_executor", lambda max_workers=None: ThreadPoolExecutor()
+    )
+    processor = BatchProcessor(batch_base)
+    broken = _BrokenPool()
+    processor._executor = broken  # type: ignore[assignment]
+
+    try:
+        processor.process_group("A")
+        assert processor._executor is not broken
+    finally:
+        if processor._executor is not broken:
+            processor._executor.shutdown()
+
+    output_folder = batch_base / "Ausgabe-A" / "worksheet"
+    assert len(list(output_folder.iterdir())) == 3
@@ -3,8 +3,10 @@
 from pathlib import Path
 
 import pytest
+from PIL import Image
 
 from worksheet_personalizer.utils.file_handler import (
+    atomic_output,
     discover_student_photos,
     ensure_output_dir,
     generate_output_filename,
@@ -23,6 +25,16 @@ def test_discover_student_photos(sample_students_folder: Path) -> None:
     assert names == sorted(names, key=str.lower)
 
 
+def test_discover_student_photos_sorts_caseless(temp_dir: Path) -> None:
+    """Test that names are sorted case-insensitively, with ß as ss."""
+    for name in ("Strauss", "straßmann", "Anna"):
+        Image.new("RGB", (10, 10)).save(temp_dir / f"{name}.jpg")
+
+    students = discover_student_photos(temp_dir)
+
+    assert [s.name for s in students] == ["Anna", "straßmann", "Strauss"]
+
+
 def test_discover_student_photos_nonexistent_folder(temp_dir: Path) -> None:
     """Test that error is raised for non-existent folder."""
     nonexistent = temp_dir / "nonexistent"
@@ -49,6 +61,21 @@ def test_discover_student_photos_empty_folder(temp_dir: Path) -> None:
         discover_student_photos(empty_folder)
 
 
+def test_discover_student_photos_skips_other_entries(
+    sample_students_folder: Path,
+) -> None:
+    """Test that uppercase extensions are found once and other entries skipped."""
+    Image.new("RGB", (10, 10)).save(sample_students_folder / "lea_weber.JPG")
+    (sample_students_folder / "notes.txt").write_text("not a photo")
+    (sample_students_folder / "folder.png").mkdir()
+
+    students = discover_student_photos(sample_students_folder)
+
+    names = [s.name for s in students]
+    assert names.count("lea weber") == 1
+    assert len(students) == 4
+
+
 def test_ensure_output_dir_creates_directory(temp_dir: Path) -> None:
     """Test that output directory is created if it doesn't exist."""
     output_path = temp_dir / "new_output"
@@ -105,3 +132,27 @@ def test_generate_output_filename_with_spaces(temp_dir: Path) -> None:
 
     assert result.name == "worksheet_anna_marie_schmidt.png"
     assert " " not in result.stem
+
+
+def test_atomic_output_replaces_file(temp_dir: Path) -> None:
+    """Test that the file only appears under its final name when complete."""
+    output_path = temp_dir / "out.pdf"
+
+    with atomic_output(output_path) as tmp_path:
+        tmp_path.write_bytes(b"data")
+        assert not output_path.exists()
+
+    assert output_path.read_bytes() == b"data"
+    assert not tmp_path.exists()
+
+
+def test_atomic_output_removes_partial_file(temp_dir: Path) -> None:
+    """Test that a failed write leaves neither the file nor a temporary file."""
+    output_path = temp_dir / "out.pdf"
+
+    with pytest.raises(RuntimeError):
+        with atomic_output(output_path) as tmp_path:
+            tmp_path.write_bytes(b"partial")
+            raise RuntimeError("write failed")
+
+    assert list(temp_dir.iterdir()) == []
@@ -133,3 +133,57 @@ def test_image_processor_different_formats(
     # Verify it's a valid JPG
     img = Image.open(jpg_output)
     assert img.format == "JPEG"
+
+
+def test_image_processor_reuses_template(
+    sample_worksheet_image: Path,
+    sample_students: list[Student],
+    output_dir: Path,
+) -> None:
+    """Test that the cached worksheet is not modified by personalization."""
+    processor = ImageProcessor(sample_worksheet_image, add_name=True)
+    processor.prepare_template()
+    template = processor._template
+    assert template is not None
+    original_pixels = template.tobytes()
+
+    for student in sample_students:
+        processor.personalize_for_student(student, output_dir / f"{student.name}.png")
+
+    assert processor._template is template
+    assert template.tobytes() == original_pixels
+
+
+@pytest.mark.parametrize("name_position", ["beside_photo", "center", "left", "right"])
+def test_image_processor_restores_template(
+    sample_worksheet_image: Path,
+    sample_students: list[Student],
+    output_dir: Path,
+    name_position: str,
+) -> None:
+    """Test that earlier students never leak into later worksheets."""
+    processor = ImageProcessor(sample_worksheet_image, add_name=True)
+    processor.name_position = name_position  # type: ignore[assignment]
+    processor.prepare_template()
+    assert processor._template is not None
+    original_pixels = processor._template.tobytes()
+
+    # A failed save must restore the worksheet as well
+    with pytest.raises(ValueError):
+        processor.personalize_for_student(
+            sample_students[0], output_dir / "missing" / "out.png"
+        )
+    assert processor._template.tobytes() == original_pixels
+
+    for student in sample_students:
+        processor.personalize_for_student(student, output_dir / f"{student.name}.png")
+    assert processor._template.tobytes() == original_pixels
+
+    fresh = ImageProcessor(sample_worksheet_image, add_name=True)
+    fresh.name_position = name_position  # type: ignore[assignment]
+    last = sample_students[-1]
+    fresh.personalize_for_student(last, output_dir / "fresh.png")
+    with Image.open(output_dir / f"{last.name}.png") as reused, Image.open(
+        output_dir / "fresh.png"
+    ) as expected:
+        assert reused.tobytes() == expected.tobytes()
@@ -1,12 +1,18 @@
 """Tests for image processing utilities."""
 
-from PIL import Image
+from pathlib import Path
+
+from PIL import Image, ImageDraw
 
 from worksheet_personalizer.utils.image_utils import (
     cm_to_pixels,
     ensure_rgb,
+    load_font,
+    load_student_photo,
     render_text_on_image,
     scale_photo,
+    scaled_student_photo,
+    text_bbox,
 )
 
 
@@ -64,6 +70,38 @@ def test_scale_photo_portrait() -> None:
     assert abs(original_ratio - scaled_ratio) < 0.01
 
 
+def test_scale_photo_resampling_depends_on_dpi() -> None:
+    """Test that LANCZOS is only used for print resolutions."""
+    img = Image.effect_noise((400, 300), 64).convert("RGB")
+
+    low = scale_photo(img, 2.0, 300)
+    high = scale_photo(img, 2.0, 1200)
+
+    assert low.tobytes() == img.resize(low.size, Image.Resampling.BILINEAR).tobytes()
+    assert high.tobytes() == img.resize(high.size, Image.Resampling.LANCZOS).tobytes()
+
+
+def test_load_student_photo(sample_student_photo: Path) -> None:
+    """Test that a photo is loaded as RGB at full resolution, uncached."""
+    photo = load_student_photo(sample_student_photo)
+
+    assert photo.mode == "RGB"
+    assert photo.size == (300, 400)
+    assert load_student_photo(sample_student_photo) is not photo
+
+
+def test_scaled_student_photo_is_cached(sample_student_photo: Path) -> None:
+    """Test that a photo is decoded and scaled once per size and DPI."""
+    mtime = sample_student_photo.stat().st_mtime
+
+    photo = scaled_student_photo(str(sample_student_photo), mtime, 1.5, 300)
+
+    assert photo.mode == "RGB"
+    assert max(photo.size) == cm_to_pixels(1.5, 300)
+    assert scaled_student_photo(str(sample_student_photo), mtime, 1.5, 300) is photo
+    assert scaled_student_photo(str(sample_student_photo), mtime, 2.0, 300) is not photo
+
+
 def test_render_text_on_image() -> None:
     """Test rendering text on an image."""
     img = Image.new("RGB", (400, 300), color="white")
@@ -79,6 +117,32 @@ def test_render_text_on_image() -> None:
     assert not all(p == (255, 255, 255) for p in pixels)
 
 
+def test_load_font_is_cached() -> None:
+    """Test that fonts are loaded once per size."""
+    assert load_font(20) is load_font(20)
+
+
+def test_render_text_on_image_shares_font_cache() -> None:
+    """Test that rendering text reuses the font loaded by load_font(size)."""
+    font = load_font(23)
+    hits = load_font.cache_info().hits
+
+    render_text_on_image(Image.new("RGB", (100, 50)), "Max", (0, 0), font_size=23)
+
+    assert load_font.cache_info().hits == hits + 1
+    assert load_font(23) is font
+
+
+def test_text_bbox_matches_draw() -> None:
+    """Test that the cached text measurement matches ImageDraw.textbbox."""
+    font = load_font(20)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+
+    assert text_bbox(font, "Max Mustermann") == draw.textbbox(
+        (0, 0), "Max Mustermann", font=font
+    )
+
+
 def test_ensure_rgb_already_rgb() -> None:
     """Test ensure_rgb with already RGB image."""
     img = Image.new("RGB", (100, 100), color="red")
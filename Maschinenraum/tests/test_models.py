@@ -61,3 +61,10 @@ def test_student_str_representation(sample_student_photo: Path) -> None:
 
     assert "Max Mustermann" in str_repr
     assert "max_mustermann.jpg" in str_repr
+
+
+def test_student_from_scanned_file(sample_student_photo: Path) -> None:
+    """Test creating a Student from a scanned file without validation."""
+    student = Student.from_scanned_file("max_mustermann", sample_student_photo)
+
+    assert student == Student(name="max_mustermann", photo_path=sample_student_photo)
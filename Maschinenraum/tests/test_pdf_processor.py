@@ -115,3 +115,125 @@ def test_pdf_processor_preserves_page_count(
     # Check page count is preserved
     output_reader = PdfReader(str(output_path))
     assert len(output_reader.pages) == original_pages
+
+
+def test_pdf_processor_multiple_students_keep_single_overlay(
+    sample_worksheet_pdf: Path,
+    sample_students: list[Student],
+    output_dir: Path,
+) -> None:
+    """Test that each student's PDF only contains their own overlay."""
+    processor = PDFProcessor(sample_worksheet_pdf, add_name=True)
+
+    output_paths = []
+    for student in sample_students:
+        output_path = output_dir / f"{student.name}.pdf"
+        processor.personalize_for_student(student, output_path)
+        output_paths.append(output_path)
+
+    sizes = [output_path.stat().st_size for output_path in output_paths]
+    # Overlays must not accumulate on the cached worksheet
+    assert max(sizes) < 2 * min(sizes)
+
+
+def test_pdf_processor_reuses_reader(sample_worksheet_pdf: Path) -> None:
+    """Test that the worksheet is parsed once and its DPI cached."""
+    processor = PDFProcessor(sample_worksheet_pdf)
+
+    reader = processor._open_worksheet()
+    dpi = processor._calculate_a4_dpi()
+
+    assert processor._open_worksheet() is reader
+    assert processor._calculate_a4_dpi() == dpi
+
+
+def test_pdf_processor_personalize_batch(
+    sample_worksheet_pdf: Path,
+    sample_students: list[Student],
+    output_dir: Path,
+) -> None:
+    """Test personalizing many students in worker processes."""
+    processor = PDFProcessor(sample_worksheet_pdf, add_name=True)
+    broken_photo = output_dir / "broken.jpg"
+    broken_photo.write_bytes(b"not an image")
+    students = sample_students + [Student(name="broken", photo_path=broken_photo)]
+    output_paths = [output_dir / f"{student.name}.pdf" for student in students]
+
+    errors = processor.personalize_batch(students, output_paths, max_workers=2)
+
+    assert [student.name for student, _ in errors] == ["broken"]
+    for output_path in output_paths[:-1]:
+        assert len(PdfReader(str(output_path)).pages) >= 1
+
+
+def test_pdf_processor_personalize_batch_length_mismatch(
+    sample_worksheet_pdf: Path,
+    sample_students: list[Student],
+    output_dir: Path,
+) -> None:
+    """Test that every student needs an output path."""
+    processor = PDFProcessor(sample_worksheet_pdf)
+
+    with pytest.raises(ValueError, match="output paths"):
+        processor.personalize_batch(sample_students, [output_dir / "one.pdf"])
+
+
+def test_pdf_processor_overlay_on_every_page(
+    temp_dir: Path,
+    sample_student_photo: Path,
+    output_dir: Path,
+) -> None:
+    """Test that all pages share a single overlay with the student's name."""
+    from reportlab.pdfgen import canvas
+
+    worksheet_path = temp_dir / "three_pages.pdf"
+    c = canvas.Canvas(str(worksheet_path))
+    for page_num in range(3):
+        c.drawString(100, 700, f"Page {page_num + 1}")
+        c.showPage()
+    c.save()
+
+    student = Student.from_photo_path(sample_student_photo)
+    processor = PDFProcessor(worksheet_path, add_name=True)
+    output_path = output_dir / "three_pages_max.pdf"
+    processor.personalize_for_student(student, output_path)
+
+    reader = PdfReader(str(output_path))
+    forms = set()
+    for page_num, page in enumerate(reader.pages, 1):
+        text = page.extract_text()
+        assert f"Page {page_num}" in text
+        assert student.name in text
+        forms.add(page["/Resources"]["/XObject"].raw_get("/WsOverlay").idnum)
+    assert len(forms) == 1
+
+
+def test_pdf_processor_photo_only_overlay_is_cached(
+    sample_worksheet_pdf: Path,
+    sample_student_photo: Path,
+) -> None:
+    """Test that overlays without a name are reused across processors."""
+    from worksheet_personalizer.core.pdf_processor import _build_photo_only_overlay
+
+    student = Student.from_photo_path(sample_student_photo)
+    _build_photo_only_overlay.cache_clear()
+
+    first = PDFProcessor(sample_worksheet_pdf)._create_overlay(student)
+    second = PDFProcessor(sample_worksheet_pdf)._create_overlay(student)
+
+    assert first.getvalue() == second.getvalue()
+    assert _build_photo_only_overlay.cache_info().hits == 1
+
+
+def test_pdf_processor_unknown_name_position(
+    sample_worksheet_pdf: Path,
+    sample_student_photo: Path,
+    output_dir: Path,
+) -> None:
+    """Test that an unknown name position is reported as an error."""
+    processor = PDFProcessor(sample_worksheet_pdf, add_name=True)
+    processor.name_position = "bottom"  # type: ignore[assignment]
+    student = Student.from_photo_path(sample_student_photo)
+
+    with pytest.raises(ValueError, match="Unknown name position"):
+        processor.personalize_for_student(student, output_dir / "out.pdf")
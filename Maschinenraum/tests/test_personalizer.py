@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from worksheet_personalizer.core.personalizer import WorksheetPersonalizer
+from worksheet_personalizer.models.student import Student
 
 
 def test_personalizer_initialization_pdf(
@@ -179,6 +180,27 @@ def test_personalizer_creates_output_directory(
     assert output_dir.is_dir()
 
 
+def test_personalizer_no_output_directory_without_students(
+    sample_worksheet_pdf: Path,
+    temp_dir: Path,
+) -> None:
+    """Test that no output directory is created if no students are found."""
+    students_dir = temp_dir / "empty_students"
+    students_dir.mkdir()
+    output_dir = temp_dir / "new_output"
+
+    personalizer = WorksheetPersonalizer(
+        worksheet_path=sample_worksheet_pdf,
+        students_folder=students_dir,
+        output_folder=output_dir,
+    )
+
+    with pytest.raises(ValueError):
+        personalizer.process_all()
+
+    assert not output_dir.exists()
+
+
 def test_personalizer_with_add_name(
     sample_worksheet_image: Path,
     sample_students_folder: Path,
@@ -196,3 +218,50 @@ def test_personalizer_with_add_name(
 
     created_files = personalizer.process_all()
     assert len(created_files) > 0
+
+
+def test_personalizer_process_all_skips_failed_student(
+    sample_worksheet_pdf: Path,
+    sample_students_folder: Path,
+    output_dir: Path,
+) -> None:
+    """Test that a broken photo does not stop the other students."""
+    (sample_students_folder / "broken.jpg").write_bytes(b"not an image")
+    personalizer = WorksheetPersonalizer(
+        worksheet_path=sample_worksheet_pdf,
+        students_folder=sample_students_folder,
+        output_folder=output_dir,
+    )
+
+    created_files = personalizer.process_all(max_workers=2)
+
+    names = [file_path.name for file_path in created_files]
+    assert names == sorted(names)
+    assert len(created_files) == 3
+    assert not (output_dir / "worksheet_broken.pdf").exists()
+
+
+def test_personalizer_copies_worksheets_for_identical_photos(
+    sample_worksheet_pdf: Path,
+    sample_students_folder: Path,
+    output_dir: Path,
+) -> None:
+    """Test that identical photos are personalized once without names."""
+    photo = sample_students_folder / "max_mustermann.jpg"
+    (sample_students_folder / "max_zwilling.jpg").write_bytes(photo.read_bytes())
+    personalizer = WorksheetPersonalizer(
+        worksheet_path=sample_worksheet_pdf,
+        students_folder=sample_students_folder,
+        output_folder=output_dir,
+    )
+
+    duplicates = personalizer._find_duplicate_photos(
+        [Student.from_photo_path(path) for path in sorted(sample_students_folder.iterdir())]
+    )
+    created_files = personalizer.process_all()
+
+    assert len(duplicates) == 1
+    assert len(created_files) == 4
+    assert (output_dir / "worksheet_max_zwilling.pdf").read_bytes() == (
+        output_dir / "worksheet_max_mustermann.pdf"
+    ).read_bytes()
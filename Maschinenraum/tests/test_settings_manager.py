@@ -0,0 +1,92 @@
+"""Tests for settings manager."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from worksheet_personalizer import settings_manager
+from worksheet_personalizer.settings_manager import (
+    SettingsManager,
+    get_settings_manager,
+)
+
+
+@pytest.fixture
+def settings_file(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the settings manager at a temporary settings file.
+
+    Returns:
+        Path to the (not yet existing) settings file
+    """
+    path = temp_dir / "settings.json"
+    monkeypatch.setattr(settings_manager, "SETTINGS_FILE", path)
+    return path
+
+
+def test_settings_manager_creates_defaults(settings_file: Path) -> None:
+    """Test that default settings are written if no file exists."""
+    manager = SettingsManager()
+
+    assert settings_file.exists()
+    assert manager.get("photo_size_cm") == 2.5
+    assert json.loads(settings_file.read_text(encoding="utf-8")) == manager.get_all()
+
+
+def test_settings_manager_invalid_file_uses_defaults(settings_file: Path) -> None:
+    """Test that an unreadable settings file is replaced by the defaults."""
+    settings_file.write_text("{not json", encoding="utf-8")
+
+    manager = SettingsManager()
+
+    assert manager.get("photo_size_cm") == 2.5
+    assert json.loads(settings_file.read_text(encoding="utf-8")) == manager.get_all()
+
+
+def test_settings_manager_set_persists(settings_file: Path) -> None:
+    """Test that changed settings are saved to the file."""
+    manager = SettingsManager()
+
+    manager.set("photo_size_cm", 3.0)
+
+    assert SettingsManager().get("photo_size_cm") == 3.0
+
+
+def test_settings_manager_batches_writes(
+    settings_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that changes in a with block are saved once on exit."""
+    manager = SettingsManager()
+    saved: list[dict] = []
+    monkeypatch.setattr(manager, "_save_settings", saved.append)
+
+    with manager:
+        manager.set("photo_size_cm", 3.0)
+        manager.update({"font_size": 14, "add_name": False})
+        assert saved == []
+
+    assert len(saved) == 1
+    assert saved[0]["font_size"] == 14
+
+
+def test_settings_manager_skips_unchanged_values(
+    settings_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that setting a value it already has does not write the file."""
+    manager = SettingsManager()
+    saved: list[dict] = []
+    monkeypatch.setattr(manager, "_save_settings", saved.append)
+
+    manager.set("photo_size_cm", manager.get("photo_size_cm"))
+    manager.update(manager.get_all())
+
+    assert saved == []
+
+
+def test_get_settings_manager_is_shared(settings_file: Path) -> None:
+    """Test that the shared settings manager is created once."""
+    get_settings_manager.cache_clear()
+    try:
+        assert get_settings_manager() is get_settings_manager()
+    finally:
+        get_settings_manager.cache_clear()